@@ -13,9 +13,26 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+from infrastructure.db_pool import (
+    PoolConfig,
+    close_db_pool,
+    get_db_adapter,
+    get_db_pool,
+    get_pool_stats,
+    init_db_pool,
+)
 from infrastructure.materialized_view_refresh_scheduler import (
     MaterializedViewRefreshScheduler,
 )
 from infrastructure.scheduler import TrendingSearchScheduler
 
-__all__ = ["TrendingSearchScheduler", "MaterializedViewRefreshScheduler"]
+__all__ = [
+    "TrendingSearchScheduler",
+    "MaterializedViewRefreshScheduler",
+    "PoolConfig",
+    "init_db_pool",
+    "get_db_pool",
+    "get_db_adapter",
+    "get_pool_stats",
+    "close_db_pool",
+]
@@ -0,0 +1,150 @@
+# Copyright (C) 2025 Veel Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+import os
+from typing import Dict, Optional
+
+import asyncpg
+from dotenv import load_dotenv
+
+from src.adapters import AsyncPostgresDatabaseAdapter, VectorIndexConfig
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class PoolConfig:
+    """
+    Configuration for the shared asyncpg connection pool.
+    """
+
+    MIN_SIZE = 10
+    MAX_SIZE = 50
+    MAX_INACTIVE_CONNECTION_LIFETIME = 300
+    COMMAND_TIMEOUT = 60
+    # Per-connection prepared statement cache for the fixed hot-path queries
+    STATEMENT_CACHE_SIZE = 1024
+    MAX_CACHED_STATEMENT_LIFETIME = 3600
+
+
+REQUIRED_ENV_VARS = (
+    "DATABASE_NAME",
+    "DATABASE_HOST",
+    "DATABASE_PORT",
+    "DATABASE_USER",
+    "DATABASE_PASSWORD",
+)
+
+_pool: Optional[asyncpg.Pool] = None
+_db_adapter: Optional[AsyncPostgresDatabaseAdapter] = None
+
+
+async def init_db_pool(config: PoolConfig = None) -> asyncpg.Pool:
+    """
+    Create the process-wide asyncpg connection pool if it does not exist yet.
+
+    Args:
+        config: Optional pool configuration override
+
+    Returns:
+        The shared asyncpg pool
+
+    Raises:
+        ValueError: If the database credentials are not set
+        RuntimeError: If the database cannot be reached
+    """
+    global _pool
+
+    if _pool is not None:
+        return _pool
+
+    config = config or PoolConfig()
+
+    env = os.environ
+    missing = [name for name in REQUIRED_ENV_VARS if not env.get(name)]
+    if missing:
+        missing_names = ", ".join(missing)
+        logger.error(f"Database credentials are not set: {missing_names}")
+        raise ValueError(
+            f"Database Credentials not set in environment variables: {missing_names}"
+        )
+
+    try:
+        _pool = await asyncpg.create_pool(
+            database=env["DATABASE_NAME"],
+            user=env["DATABASE_USER"],
+            password=env["DATABASE_PASSWORD"],
+            host=env["DATABASE_HOST"],
+            port=env["DATABASE_PORT"],
+            min_size=config.MIN_SIZE,
+            max_size=config.MAX_SIZE,
+            max_inactive_connection_lifetime=config.MAX_INACTIVE_CONNECTION_LIFETIME,
+            command_timeout=config.COMMAND_TIMEOUT,
+            statement_cache_size=config.STATEMENT_CACHE_SIZE,
+            max_cached_statement_lifetime=config.MAX_CACHED_STATEMENT_LIFETIME,
+            init=AsyncPostgresDatabaseAdapter.register_vector_codec,
+            server_settings=VectorIndexConfig.server_settings(),
+        )
+        logger.info("Connected to Postgres database")
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+        logger.error(f"Could not connect to PostgreSQL: {e}")
+        raise RuntimeError("Database connection failed") from e
+
+    return _pool
+
+
+def get_db_pool() -> asyncpg.Pool:
+    """Return the shared pool; `init_db_pool` must have been awaited first."""
+    if _pool is None:
+        raise RuntimeError("Database pool is not initialized")
+    return _pool
+
+
+def get_pool_stats() -> Dict[str, int]:
+    """Return current size and idle-connection counts of the shared pool."""
+    pool = get_db_pool()
+    return {
+        "size": pool.get_size(),
+        "idle": pool.get_idle_size(),
+        "max_size": pool.get_max_size(),
+    }
+
+
+def get_db_adapter() -> AsyncPostgresDatabaseAdapter:
+    """Return the process-wide database adapter bound to the shared pool."""
+    global _db_adapter
+
+    pool = get_db_pool()
+    if _db_adapter is None or _db_adapter.pool is not pool:
+        _db_adapter = AsyncPostgresDatabaseAdapter(pool=pool)
+    return _db_adapter
+
+
+async def close_db_pool() -> None:
+    """Close the shared pool and release all of its connections."""
+    global _pool, _db_adapter
+
+    if _pool is None:
+        return
+
+    try:
+        await _pool.close()
+        logger.info("Database connection pool closed")
+    finally:
+        _pool = None
+        _db_adapter = None
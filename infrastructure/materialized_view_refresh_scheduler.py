@@ -15,43 +15,131 @@
 
 import asyncio
 import logging
+import time
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
 class MaterializedViewRefreshScheduler:
-    def __init__(self, database_adapter, interval_minutes: int = 15):
+    def __init__(
+        self,
+        database_adapter,
+        interval_minutes: int = 15,
+        min_rows_threshold: int = 1,
+        max_delay_minutes: Optional[int] = None,
+    ):
+        """
+        Args:
+            database_adapter: Adapter used to read source-table changes and refresh views
+            interval_minutes: Minimum delay between two refresh checks
+            min_rows_threshold: Rows that must have changed in the source tables
+                since the last refresh before a refresh is fired
+            max_delay_minutes: If set, any pending change below the threshold is
+                still flushed once the last refresh is at least this old
+        """
         self.database_adapter = database_adapter
         self.interval = interval_minutes
+        self.min_rows_threshold = min_rows_threshold
+        self.max_delay = max_delay_minutes
         self._task: asyncio.Task | None = None
         self.is_running = False
+        self._last_change_counter: Optional[int] = None
+        self._last_refresh_at: Optional[float] = None
+        self._stop_event = asyncio.Event()
+        self._trigger_event = asyncio.Event()
+
+    async def _should_refresh(self) -> tuple[bool, Optional[int]]:
+        """Decide whether the source tables changed enough to warrant a refresh."""
+        try:
+            counter = await self.database_adapter.get_materialized_view_source_changes()
+        except Exception as e:
+            logger.warning(f"Could not read source-table changes, refreshing: {e}")
+            return True, None
+
+        if self._last_change_counter is None:
+            return True, counter
+
+        # Counters go backwards when statistics are reset; treat that as a change
+        delta = counter - self._last_change_counter
+        if delta < 0 or delta >= self.min_rows_threshold:
+            return True, counter
+
+        if delta > 0 and self.max_delay is not None and self._last_refresh_at:
+            if time.monotonic() - self._last_refresh_at >= self.max_delay * 60:
+                return True, counter
+
+        logger.info(
+            f"Skipping materialized view refresh ({delta} changed rows, "
+            f"threshold {self.min_rows_threshold})"
+        )
+        return False, counter
+
+    async def _wait_for_next_tick(self) -> bool:
+        """
+        Block until the interval elapses, `stop()` is called or a refresh is triggered.
+
+        Returns:
+            True if the wake-up came from `trigger_refresh()`
+        """
+        waiters = [
+            asyncio.create_task(self._stop_event.wait()),
+            asyncio.create_task(self._trigger_event.wait()),
+        ]
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self.interval * 60,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+        triggered = self._trigger_event.is_set()
+        self._trigger_event.clear()
+        return triggered
 
     async def _run(self):
 
         logger.info("Materialized view scheduler started")
+        forced = False
         try:
-            while True:
+            while not self._stop_event.is_set():
                 try:
-                    logger.info("Refreshing materialized view")
-                    await self.database_adapter.refresh_materialized_view_tables()
-                    logger.info("Materialized view refresh completed")
+                    should_refresh, counter = await self._should_refresh()
+                    if forced or should_refresh:
+                        logger.info("Refreshing materialized view")
+                        await self.database_adapter.refresh_materialized_view_tables()
+                        self._last_change_counter = counter
+                        self._last_refresh_at = time.monotonic()
+                        logger.info("Materialized view refresh completed")
                 except Exception as e:
                     logger.exception("Materialized view refresh failed", exc_info=e)
 
-                await asyncio.sleep(self.interval * 60)
+                forced = await self._wait_for_next_tick()
 
         except asyncio.CancelledError:
             logger.info("Materialized view scheduler cancelled")
             raise
 
+        logger.info("Materialized view scheduler stopped")
+
     def start(self):
         if self.is_running:
             return
 
         self.is_running = True
+        self._stop_event.clear()
+        self._trigger_event.clear()
         self._task = asyncio.create_task(self._run())
 
+    def trigger_refresh(self):
+        """Wake the scheduler and refresh immediately, bypassing change detection."""
+        if self.is_running:
+            self._trigger_event.set()
+
     def stop(self):
         if self._task:
-            self._task.cancel()
+            self._stop_event.set()
             self.is_running = False
@@ -19,11 +19,8 @@ from datetime import datetime, timezone
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
-from src.adapters import (
-    AsyncOpenAIApiAdapter,
-    AsyncPostgresDatabaseAdapter,
-    TrendingSearchAdapter,
-)
+from infrastructure.db_pool import PoolConfig, get_db_adapter, get_pool_stats
+from src.adapters import TrendingSearchAdapter, get_openai_adapter
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +29,19 @@ class TrendingSearchScheduler:
     """
     Scheduler for periodic execution of trending search pipeline.
     Manages the lifecycle of the batch processing.
+
+    Invariant: MAX_INSTANCES * CONNECTIONS_PER_RUN must stay at or below
+    PoolConfig.MAX_SIZE - POOL_SAFETY_MARGIN so batch runs can never starve
+    GraphQL resolvers of pooled connections; `start` refuses to run otherwise.
     """
 
+    # A pipeline run holds at most one pooled connection at a time
+    CONNECTIONS_PER_RUN = 1
+    # Connections always left to request traffic
+    POOL_SAFETY_MARGIN = 5
+    # Runs persist a full trend snapshot, so they must never overlap
+    MAX_INSTANCES = 1
+
     def __init__(self, interval_minutes: int = 15):
         """
         Initialize the scheduler.
@@ -52,6 +60,8 @@ class TrendingSearchScheduler:
                 logger.warning("Scheduler is already running")
                 return
 
+            self._check_pool_budget()
+
             # Schedule the job
             self.scheduler.add_job(
                 self._run_pipeline,
@@ -59,8 +69,11 @@ class TrendingSearchScheduler:
                 id="trending_search_batch",
                 name="Trending Search Batch Processing",
                 replace_existing=True,
-                max_instances=1,
+                max_instances=self.MAX_INSTANCES,
                 coalesce=True,
+                # Late runs still fire within half an interval; older ones are
+                # dropped rather than burst-fired after a pause
+                misfire_grace_time=self.interval_minutes * 60 // 2,
             )
 
             self.scheduler.start()
@@ -75,6 +88,21 @@ class TrendingSearchScheduler:
             logger.error(f"Error starting scheduler: {e}")
             raise
 
+    @classmethod
+    def _check_pool_budget(cls) -> None:
+        """
+        Raises:
+            ValueError: If overlapping runs could hold more pooled connections
+                than the pool leaves beside POOL_SAFETY_MARGIN
+        """
+        needed = cls.MAX_INSTANCES * cls.CONNECTIONS_PER_RUN
+        budget = PoolConfig.MAX_SIZE - cls.POOL_SAFETY_MARGIN
+        if needed > budget:
+            raise ValueError(
+                f"Trending runs may hold {needed} pooled connections but only "
+                f"{budget} of PoolConfig.MAX_SIZE={PoolConfig.MAX_SIZE} are available"
+            )
+
     async def _run_pipeline(self):
         """Execute a single pipeline run."""
         try:
@@ -83,8 +111,8 @@ class TrendingSearchScheduler:
             logger.info(f"Timestamp: {datetime.now(timezone.utc)}")
 
             # Initialize ports
-            database_port = AsyncPostgresDatabaseAdapter()
-            openai_port = AsyncOpenAIApiAdapter()
+            database_port = get_db_adapter()
+            openai_port = get_openai_adapter()
 
             # Create pipeline adapter
             pipeline = TrendingSearchAdapter(
@@ -95,6 +123,7 @@ class TrendingSearchScheduler:
             result = await pipeline.run_batch_pipeline()
 
             logger.info(f"Pipeline completed: {result}")
+            logger.info("Database pool stats: %s", get_pool_stats())
             logger.info("=" * 70)
 
         except Exception as e:
@@ -15,14 +15,19 @@
 
 import argparse
 import asyncio
-import json
+import gzip
+import hashlib
 import logging
+import sqlite3
 from datetime import datetime, timezone
+from typing import Dict, List
 
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 
-from src.adapters.openai_adapter import AsyncOpenAIApiAdapter
-from src.adapters.postgres_database_adapter import AsyncPostgresDatabaseAdapter
+from infrastructure.db_pool import close_db_pool, get_db_adapter, init_db_pool
+from src.adapters.openai_adapter import get_openai_adapter
 from src.application.services.trending_search_service import (
     QueryNormalizationService,
     SemanticClusteringService,
@@ -32,6 +37,60 @@ from src.application.services.trending_search_service import (
 logger = logging.getLogger("process_full_history")
 logging.basicConfig(level=logging.INFO)
 
+# Rows normalized per `normalize_many` call while streaming the history
+NORMALIZE_CHUNK_SIZE = 5000
+# SQLite caps bound parameters per statement at 999 on older builds
+CACHE_LOOKUP_CHUNK_SIZE = 900
+
+
+class EmbeddingCache:
+    """
+    Persistent SQLite cache of query embeddings keyed by model and query hash,
+    so re-runs only send queries that were never embedded before to OpenAI.
+    """
+
+    def __init__(self, path: str):
+        # Accessed from worker threads via asyncio.to_thread, one call at a time
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings_cache "
+            "(key TEXT PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+
+    @staticmethod
+    def key(model: str, query: str) -> str:
+        digest = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{model}:{digest}"
+
+    def get_many(self, model: str, queries: List[str]) -> Dict[str, np.ndarray]:
+        """Return cached float32 vectors for the queries that have one."""
+        keys = {self.key(model, q): q for q in queries}
+        key_list = list(keys)
+        found = {}
+        for i in range(0, len(key_list), CACHE_LOOKUP_CHUNK_SIZE):
+            chunk = key_list[i : i + CACHE_LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            for key, vec in self.conn.execute(
+                f"SELECT key, vec FROM embeddings_cache WHERE key IN ({placeholders})",
+                chunk,
+            ):
+                found[keys[key]] = np.frombuffer(vec, dtype=np.float32)
+        return found
+
+    def put_many(self, model: str, queries: List[str], vectors) -> None:
+        """Upsert freshly computed vectors."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings_cache (key, vec) VALUES (?, ?)",
+                (
+                    (self.key(model, q), np.asarray(v, dtype=np.float32).tobytes())
+                    for q, v in zip(queries, vectors)
+                ),
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
 
 async def main():
     load_dotenv()
@@ -42,94 +101,127 @@ async def main():
         default=None,
         help="When fetching full history, limit to this many most-recent rows",
     )
+    parser.add_argument(
+        "--embedding-cache",
+        default="embeddings_cache.sqlite3",
+        help="SQLite file used to reuse embeddings across runs",
+    )
     args = parser.parse_args()
 
     config = TrendingSearchConfig()
 
     # instantiate adapters/services
-    db = AsyncPostgresDatabaseAdapter()
-    openai_adapter = AsyncOpenAIApiAdapter()
+    await init_db_pool()
+    db = get_db_adapter()
+    openai_adapter = get_openai_adapter()
     normalizer = QueryNormalizationService()
     clustering = SemanticClusteringService(config=config)
+    embedding_cache = EmbeddingCache(args.embedding_cache)
 
     try:
-        # Fetch all historical queries (None => use max_rows to bound)
-        rows = await db.ingest_queries(None, max_rows=args.max_rows)
-        if not rows:
+        # Stream the history into columns, keeping only the unique normalized
+        # queries and a per-row index into them
+        unique_queries = []
+        query_index = {}
+        row_index = []
+        pending = []
+
+        async def flush(pending_rows, out):
+            originals = [r["original_query"] for r in pending_rows]
+            normalized = await normalizer.normalize_many(originals)
+            for r, query in zip(pending_rows, normalized):
+                idx = query_index.get(query)
+                if idx is None:
+                    idx = query_index[query] = len(unique_queries)
+                    unique_queries.append(query)
+                row_index.append(idx)
+                out.write(
+                    orjson.dumps({"query": query, "original_query": r["original_query"]})
+                    + b"\n"
+                )
+
+        with open("queries_data.ndjson", "wb") as queries_file:
+            async for r in db.iter_queries(None, max_rows=args.max_rows):
+                pending.append(r)
+                if len(pending) >= NORMALIZE_CHUNK_SIZE:
+                    await flush(pending, queries_file)
+                    pending = []
+            if pending:
+                await flush(pending, queries_file)
+
+        if not row_index:
             logger.info("No rows found in video_seo_response_history")
             return
 
-        # Normalize queries
-        for r in rows:
-            r["query"] = await normalizer.normalize(r["original_query"])
-
-        # Deduplicate for embeddings
-        unique_queries = list({r["query"] for r in rows})
         logger.info(
-            f"Vectorizing {len(unique_queries)} unique queries (from {len(rows)} total)"
+            f"Vectorizing {len(unique_queries)} unique queries "
+            f"(from {len(row_index)} total)"
         )
 
-        # Get embeddings (this will hit OpenAI)
-        embeddings = await openai_adapter.text_embedding(
-            text=unique_queries, model=config.EMBEDDING_MODEL
+        # Only queries missing from the cache hit OpenAI
+        cached = await asyncio.to_thread(
+            embedding_cache.get_many, config.EMBEDDING_MODEL, unique_queries
+        )
+        missing = [q for q in unique_queries if q not in cached]
+        logger.info(
+            f"{len(cached)} embeddings reused from cache, {len(missing)} to fetch"
         )
 
-        # Map back to rows
-        query_to_embedding = {q: emb for q, emb in zip(unique_queries, embeddings)}
-        queries_with_embeddings = []
-        for r in rows:
-            emb = query_to_embedding.get(r["query"])
-            if emb is None:
-                # Shouldn't happen, but skip if embedding missing
-                continue
-            queries_with_embeddings.append(
-                {
-                    "original_query": r["original_query"],
-                    "query": r["query"],
-                    "chat_id": r.get("chat_id"),
-                    "created_at": r.get("created_at"),
-                    "embedding": emb,
-                }
+        if missing:
+            fetched = await openai_adapter.text_embedding(
+                text=missing, model=config.EMBEDDING_MODEL
             )
+            await asyncio.to_thread(
+                embedding_cache.put_many, config.EMBEDDING_MODEL, missing, fetched
+            )
+            cached.update(zip(missing, fetched))
+
+        unique_embeddings = np.asarray(
+            [cached[q] for q in unique_queries], dtype=np.float32
+        )
+        row_index = np.asarray(row_index, dtype=np.int32)
 
-        logger.info(f"Running clustering on {len(queries_with_embeddings)} items")
+        # Contiguous (N, D) matrix, one row per history row
+        row_embeddings = unique_embeddings[row_index]
 
-        clusters = await clustering.cluster_queries(queries_with_embeddings)
+        logger.info(f"Running clustering on {len(row_embeddings)} items")
 
-        embeddings_data = {
-            "queries": [q["query"] for q in queries_with_embeddings],
-            "embeddings": [q["embedding"] for q in queries_with_embeddings],
-        }
-        with open(f"embeddings_data.json", "w") as f:
-            json.dump(embeddings_data, f)
+        clusters = await clustering.cluster_embeddings(row_embeddings)
 
-        queries_data = {
-            "queries": [q["query"] for q in queries_with_embeddings],
-            "original_queries": [q["original_query"] for q in queries_with_embeddings],
-        }
-        with open(f"queries_data.json", "w") as f:
-            json.dump(queries_data, f)
+        # One float32 row per unique query plus a per-row index into it; the
+        # query text lives next to it since npz cannot hold it without pickling
+        np.savez(
+            "embeddings_data.npz",
+            embeddings=unique_embeddings,
+            row_index=row_index,
+        )
+        with gzip.open("embeddings_queries.json.gz", "wb") as f:
+            f.write(orjson.dumps(unique_queries))
 
         logger.info(f"Found {len(clusters)} clusters")
         for cid, indices in clusters.items():
-            sample_queries = [queries_with_embeddings[i]["query"] for i in indices[:5]]
+            sample_queries = [unique_queries[row_index[i]] for i in indices[:5]]
             logger.info(
                 f"Cluster {cid}: size={len(indices)}, examples={sample_queries}"
             )
 
         # Optional: save output for offline analysis
         out_path = f"trending_history_clusters.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(
-                {str(k): v for k, v in clusters.items()},
-                f,
-                ensure_ascii=False,
-                indent=2,
+        with open(out_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    clusters,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY,
+                )
             )
         logger.info(f"Wrote cluster indices to {out_path}")
 
     finally:
+        embedding_cache.close()
+        await openai_adapter.aclose()
         try:
-            await db.close()
+            await close_db_pool()
         except Exception:
             logger.error("Error occurred while closing the database connection", exc_info=True)
@@ -14,8 +14,11 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from src.adapters.health_service_adapter import HealthServiceAdapter
-from src.adapters.openai_adapter import AsyncOpenAIApiAdapter
-from src.adapters.postgres_database_adapter import AsyncPostgresDatabaseAdapter
+from src.adapters.openai_adapter import AsyncOpenAIApiAdapter, get_openai_adapter
+from src.adapters.postgres_database_adapter import (
+    AsyncPostgresDatabaseAdapter,
+    VectorIndexConfig,
+)
 from src.adapters.trending_search_adapter import TrendingSearchAdapter
 from src.adapters.video_seo_query_pipeline_adapter import VideoSEOQueryAdapter
 
@@ -25,4 +28,6 @@ __all__ = [
     "VideoSEOQueryAdapter",
     "HealthServiceAdapter",
     "TrendingSearchAdapter",
+    "get_openai_adapter",
+    "VectorIndexConfig",
 ]
@@ -18,12 +18,12 @@ from typing import Optional
 import strawberry
 from strawberry.experimental import pydantic
 
+from infrastructure.db_pool import get_db_adapter
 from src.adapters import (
-    AsyncOpenAIApiAdapter,
-    AsyncPostgresDatabaseAdapter,
     HealthServiceAdapter,
     TrendingSearchAdapter,
     VideoSEOQueryAdapter,
+    get_openai_adapter,
 )
 from src.domain.models import (
     HealthResponseModel,
@@ -40,6 +40,11 @@ from src.domain.models import (
 
 adapter = HealthServiceAdapter()
 
+# The GraphQL types below are generated from the domain models by Strawberry's
+# pydantic integration, which builds the dataclasses itself and has no option
+# for __slots__. They are defined only here; import them from this module
+# rather than redeclaring them.
+
 
 @strawberry.experimental.pydantic.type(model=HealthResponseModel, all_fields=True)
 class HealthResponseType:
@@ -116,8 +121,8 @@ class Query:
     async def search_video_connections(
         self, video_seo_request: VideoSEORequestType
     ) -> VideoSEOResponseType:
-        database_adapter = AsyncPostgresDatabaseAdapter()
-        openai_adapter = AsyncOpenAIApiAdapter()
+        database_adapter = get_db_adapter()
+        openai_adapter = get_openai_adapter()
 
         run_seo_query = VideoSEOQueryAdapter(
             database_port=database_adapter, openai_client_port=openai_adapter
@@ -140,8 +145,8 @@ class Query:
     ) -> TrendingSearchResponseType:
         """Get current trending searches."""
         try:
-            database_adapter = AsyncPostgresDatabaseAdapter()
-            openai_adapter = AsyncOpenAIApiAdapter()
+            database_adapter = get_db_adapter()
+            openai_adapter = get_openai_adapter()
 
             pipeline = TrendingSearchAdapter(
                 database_port=database_adapter, openai_client_port=openai_adapter
@@ -155,17 +160,17 @@ class Query:
             return TrendingSearchResponseType.from_pydantic(validated)
 
         except Exception as e:
-            error_response = TrendingSearchResponseModel(
+            # Built directly: the fields are fixed, so pydantic validation is skipped
+            return TrendingSearchResponseType(
                 status="error", trending_searches=[], error=str(e)
             )
-            return TrendingSearchResponseType.from_pydantic(error_response)
 
     @strawberry.field
     async def get_popular_videos(
         self, popular_video_request: PopularVideosRequestType
     ) -> PopularVideosResponseType:
         try:
-            database_adapter = AsyncPostgresDatabaseAdapter()
+            database_adapter = get_db_adapter()
 
             result = await database_adapter.search_popular_videos(
                 limit=popular_video_request.limit
@@ -175,7 +180,6 @@ class Query:
             )
             return PopularVideosResponseType.from_pydantic(validated)
         except Exception as e:
-            error_response = PopularVideosResponseModel(
+            return PopularVideosResponseType(
                 status="error", popular_videos=[], error=str(e)
             )
-            return PopularVideosResponseType.from_pydantic(error_response)
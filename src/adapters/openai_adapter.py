@@ -13,15 +13,43 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import base64
+import hashlib
 import logging
+import mimetypes
 import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
-
+from functools import cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+import httpx
+import numpy as np
+import orjson
+from cachetools import LRUCache
 from dotenv import load_dotenv
-from openai import AsyncClient
+from openai import (
+    AsyncClient,
+    AsyncStream,
+    DefaultAioHttpClient,
+    DefaultAsyncHttpxClient,
+)
 from openai.types.audio import TranscriptionVerbose
-from openai.types.responses import Response
+from openai.types.responses import Response, ResponseStreamEvent
 from pydantic import BaseModel
 
 from src.ports.output import AsyncOpenAIAPIPort
@@ -31,6 +59,14 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Read once at import, after the .env file has been loaded
+_OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# "aiohttp" swaps the SDK's httpx transport for aiohttp (needs openai[aiohttp])
+_OPENAI_HTTP_BACKEND = os.getenv("OPENAI_HTTP_BACKEND", "httpx").lower()
+
+
+ToolChoice = Literal["auto", "required", "none"]
+
 
 class ResponseConfig:
     """
@@ -39,27 +75,287 @@ class ResponseConfig:
 
     DEFAULT_MODEL = "gpt-4o-mini"
     DEFAULT_TEMPERATURE = 0.6
-    TOOL_CHOICE_AUTO = "auto"
-    TOOL_CHOICE_REQUIRED = "required"
-    MODELS_WITHOUT_TEMPERATURE = ["gpt-5", "gpt-5-mini"]
+    TOOL_CHOICE_AUTO: ToolChoice = "auto"
+    TOOL_CHOICE_REQUIRED: ToolChoice = "required"
+    MODELS_WITHOUT_TEMPERATURE = frozenset({"gpt-5", "gpt-5-mini"})
+
+
+class HttpClientConfig:
+    """
+    Connection pool settings for the shared OpenAI HTTP client.
+    """
+
+    MAX_CONNECTIONS = 1024
+    MAX_KEEPALIVE_CONNECTIONS = 512
+    KEEPALIVE_EXPIRY = 60
+    TIMEOUT = 60
+    CONNECT_TIMEOUT = 10
+    # Multiplex concurrent requests over a few TLS connections (httpx only)
+    HTTP2 = True
+    # The SDK retries 408/409/429/5xx and connection errors with jittered
+    # exponential backoff, honouring Retry-After
+    MAX_RETRIES = 5
+
+
+class ConcurrencyConfig:
+    """
+    Process-wide caps on in-flight OpenAI requests, per endpoint and model.
+
+    Throttling locally keeps bursts under the account's rate limits instead of
+    letting them turn into 429s that the SDK then retries one by one.
+    """
+
+    MAX_CONCURRENT_RESPONSES = int(os.getenv("OPENAI_MAX_CONCURRENT_RESPONSES", 32))
+    MAX_CONCURRENT_EMBEDDINGS = int(os.getenv("OPENAI_MAX_CONCURRENT_EMBEDDINGS", 16))
+    MAX_CONCURRENT_TRANSCRIPTIONS = int(
+        os.getenv("OPENAI_MAX_CONCURRENT_TRANSCRIPTIONS", 8)
+    )
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Build the HTTP client shared by every OpenAI call in the process."""
+    kwargs = {
+        "limits": httpx.Limits(
+            max_connections=HttpClientConfig.MAX_CONNECTIONS,
+            max_keepalive_connections=HttpClientConfig.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HttpClientConfig.KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(
+            HttpClientConfig.TIMEOUT, connect=HttpClientConfig.CONNECT_TIMEOUT
+        ),
+    }
+    if _OPENAI_HTTP_BACKEND == "aiohttp":
+        # aiohttp keeps throughput up under heavy request fan-out
+        return DefaultAioHttpClient(**kwargs)
+    return DefaultAsyncHttpxClient(http2=HttpClientConfig.HTTP2, **kwargs)
+
+
+class EmbeddingConfig:
+    """
+    Configuration for embedding requests.
+    """
+
+    # OpenAI rejects input arrays longer than 2048 items per request
+    BATCH_SIZE = 1000
+    MAX_CONCURRENT_REQUESTS = 8
+    CACHE_MAX_SIZE = 10_000
+
+
+# Process-wide embedding cache keyed by (model, text) digest. Only touched from
+# the event loop between awaits, so no lock is needed.
+_embedding_cache: LRUCache = LRUCache(maxsize=EmbeddingConfig.CACHE_MAX_SIZE)
+
+
+def _embedding_cache_key(model: str, text: str) -> bytes:
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+
+def _decode_embedding(data: str) -> np.ndarray:
+    """Decode a base64 float32 embedding; the result is read-only and safe to cache."""
+    return np.frombuffer(base64.b64decode(data), dtype=np.float32)
+
+
+# Tool definitions per schema class; weak keys let dynamically built models go.
+# Values are shared across calls, so they are stored read-only.
+_SCHEMA_TOOLS: "WeakKeyDictionary[type, Tuple[Mapping[str, Any], ...]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _read_file_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _get_schema_tools(schema_model: Type[BaseModel]) -> Tuple[Mapping[str, Any], ...]:
+    """
+    Return the (cached, read-only) function tool definition for a Pydantic schema.
+
+    The schema class is validated only when its definition is first built, so
+    repeat calls are a single dict lookup.
+
+    Raises:
+        ValueError: If schema_model is not a Pydantic BaseModel subclass
+    """
+    tools = _SCHEMA_TOOLS.get(schema_model) if isinstance(schema_model, type) else None
+    if tools is None:
+        if not isinstance(schema_model, type) or not issubclass(
+            schema_model, BaseModel
+        ):
+            raise ValueError(
+                f"schema_model must be a Pydantic BaseModel, got {type(schema_model)}"
+            )
+        schema_name = schema_model.__name__
+        tools = (
+            MappingProxyType(
+                {
+                    "type": "function",
+                    "name": f"get_{schema_name.lower()}_data",
+                    "description": f"Generate structured data conforming to {schema_name} schema",
+                    "parameters": schema_model.model_json_schema(),
+                }
+            ),
+        )
+        _SCHEMA_TOOLS[schema_model] = tools
+        logger.debug("Auto-generated tool definition for %s", schema_name)
+    return tools
+
+
+class SemanticCacheConfig:
+    """
+    Configuration for the semantic `response()` cache.
+    """
+
+    SIMILARITY_THRESHOLD = 0.97
+    # Entries kept per (model, instructions) pair; oldest are overwritten first
+    MAX_ENTRIES = 1024
+    EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+class SemanticResponseCache:
+    """
+    Nearest-neighbour cache of model responses for one (model, instructions) pair.
+
+    Prompts are stored as unit-normalised embeddings in a fixed-size ring buffer,
+    so a lookup is a single matrix-vector product.
+    """
+
+    def __init__(self, max_entries: int = SemanticCacheConfig.MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: List[Response] = []
+        self._next = 0
+
+    @staticmethod
+    def _normalise(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: np.ndarray, threshold: float) -> Optional[Response]:
+        """Return the cached response whose prompt is most similar, if close enough."""
+        if not self._responses:
+            return None
+
+        scores = self._vectors[: len(self._responses)] @ self._normalise(embedding)
+        best = int(np.argmax(scores))
+        return self._responses[best] if scores[best] >= threshold else None
+
+    def add(self, embedding: np.ndarray, response: Response) -> None:
+        vector = self._normalise(embedding)
+        if self._vectors is None:
+            self._vectors = np.empty((self.max_entries, len(vector)), dtype=np.float32)
+
+        self._vectors[self._next] = vector
+        if len(self._responses) < self.max_entries:
+            self._responses.append(response)
+        else:
+            self._responses[self._next] = response
+        self._next = (self._next + 1) % self.max_entries
 
 
 class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
     """
     A wrapper class for OpenAI's AsyncClient that simplifies making API calls.
+
+    The adapter is the sole owner of the process's OpenAI client and its
+    keep-alive connection pool; use `get_openai_adapter()` rather than building
+    other clients, and `aclose()` it on shutdown.
     """
 
     def __init__(self):
-        self.openai_api_key = os.getenv(
-            "OPENAI_API_KEY", os.environ.get("OPENAI_API_KEY", None)
-        )
+        self.openai_api_key = _OPENAI_API_KEY
 
         if not self.openai_api_key:
             raise ValueError(
                 "OpenAI API Key must be provided via environment variables or .env file"
             )
 
-        self.client = AsyncClient(api_key=self.openai_api_key)
+        self._semantic_caches: Dict[tuple, SemanticResponseCache] = {}
+        # Clients and in-flight calls are bound to the loop that created them,
+        # so each running loop gets its own, built on first use
+        self._clients: WeakKeyDictionary = WeakKeyDictionary()
+        self._inflight_by_loop: WeakKeyDictionary = WeakKeyDictionary()
+        self._limiters_by_loop: WeakKeyDictionary = WeakKeyDictionary()
+
+    @property
+    def client(self) -> AsyncClient:
+        """The OpenAI client for the running event loop, created lazily."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed():
+            client = self._clients[loop] = self._new_client(_build_http_client())
+        return client
+
+    async def warm(self) -> None:
+        """
+        Build the running loop's client before its first request. The HTTP
+        client, whose TLS context setup is the costly part, is created in a
+        worker thread so startup can overlap it with other work.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is not None and not client.is_closed():
+            return
+
+        http_client = await asyncio.to_thread(_build_http_client)
+        client = self._clients.get(loop)
+        if client is None or client.is_closed():
+            self._clients[loop] = self._new_client(http_client)
+        else:
+            # A request built one while the thread was running
+            await http_client.aclose()
+
+    def _new_client(self, http_client: httpx.AsyncClient) -> AsyncClient:
+        return AsyncClient(
+            api_key=self.openai_api_key,
+            http_client=http_client,
+            max_retries=HttpClientConfig.MAX_RETRIES,
+        )
+
+    @property
+    def _inflight(self) -> Dict[Any, asyncio.Task]:
+        """In-flight API calls by request key, shared by identical concurrent calls."""
+        return self._inflight_by_loop.setdefault(asyncio.get_running_loop(), {})
+
+    def _limiter(self, endpoint: str, model: str) -> asyncio.Semaphore:
+        """
+        Semaphore capping concurrent calls to `endpoint` for `model` on the
+        running loop. Rate limits are per model, so each model gets its own.
+        """
+        limiters = self._limiters_by_loop.setdefault(asyncio.get_running_loop(), {})
+        semaphore = limiters.get((endpoint, model))
+        if semaphore is None:
+            limit = {
+                "responses": ConcurrencyConfig.MAX_CONCURRENT_RESPONSES,
+                "embeddings": ConcurrencyConfig.MAX_CONCURRENT_EMBEDDINGS,
+                "transcriptions": ConcurrencyConfig.MAX_CONCURRENT_TRANSCRIPTIONS,
+            }[endpoint]
+            semaphore = limiters[(endpoint, model)] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def _single_flight(
+        self, key: Any, call: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Future:
+        """
+        Run `call` once for all concurrent callers using the same key.
+
+        The underlying task is shielded, so one caller being cancelled does not
+        cancel the request for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return asyncio.shield(task)
+
+    async def aclose(self) -> None:
+        """Close the running loop's HTTP client and its pooled connections."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+            logger.info("OpenAI client closed")
 
     async def audio_transcription(
         self,
@@ -76,7 +372,7 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
             timestamp_granularities: Timestamp levels, e.g. ["word", "segment"]
 
         Returns:
-            Dictionary with transcription text and timestamps
+            The verbose transcription with text and segment timestamps
 
         Raises:
             FileNotFoundError: If audio file doesn't exist
@@ -85,53 +381,151 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
         if timestamp_granularities is None:
             timestamp_granularities = ["segment"]
 
-        audio_file = Path(audio_path)
-        # Basic validation
-        if not audio_file.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        audio_path = os.fspath(audio_path)
+        file_name = os.path.basename(audio_path)
+
+        # Read off the event loop so large files don't stall other requests;
+        # the open itself is the existence check, no separate stat needed
+        try:
+            audio_bytes = await asyncio.to_thread(_read_file_bytes, audio_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Audio file not found: {audio_path}") from e
 
-        logger.info(f"Transcribing: {audio_file.name} with model {model}")
+        logger.info("Transcribing: %s with model %s", file_name, model)
+        content_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
 
         try:
-            with open(audio_path, "rb") as f:
+            async with self._limiter("transcriptions", model):
                 response = await self.client.audio.transcriptions.create(
-                    file=f,
+                    file=(file_name, audio_bytes, content_type),
                     model=model,
                     response_format="verbose_json",
                     timestamp_granularities=timestamp_granularities,
                 )
 
-            return response.model_dump()
+            # Returned as the SDK model; dumping to a dict re-walks every segment
+            return response
 
         except Exception as e:
-            logger.error(f"Transcription failed for {audio_file.name}: {e}")
+            logger.error("Transcription failed for %s: %s", file_name, e)
             raise
 
-    async def text_embedding(self, text: str, model: str = "text-embedding-3-small"):
+    async def text_embedding(
+        self, text: Union[str, Sequence[str]], model: str = "text-embedding-3-small"
+    ) -> np.ndarray:
         """
-        Perform embedding of the given text.
+        Perform embedding of the given text or batch of texts.
         Args:
-            text: transcribed text to embed
+            text: transcribed text, or a sequence of texts embedded in one batch
             model: Embedding model to use (default: text-embedding-3-small)
         Returns:
-            List of embeddings
+            float32 array of shape (len(inputs), dimensions), one row per input
+            text in input order
         """
 
         if not text:
             raise ValueError("Text input is empty or None for embedding")
 
-        logger.info("Embedding the text or text segments")
+        inputs = [text] if isinstance(text, str) else list(text)
+        keys = [_embedding_cache_key(model, t) for t in inputs]
+
+        # Only inputs missing from the cache go to the API, each one once;
+        # inputs another call is already fetching are awaited, not re-sent
+        # Cache hits are copied out now: the awaits below can let this or a
+        # concurrent call's update evict them from the LRU
+        vectors: Dict[bytes, np.ndarray] = {}
+        missing = {}
+        pending = set()
+        for key, t in zip(keys, inputs):
+            if key in vectors or key in missing:
+                continue
+            cached = _embedding_cache.get(key)
+            if cached is not None:
+                vectors[key] = cached
+                continue
+            task = self._inflight.get(("embedding", key))
+            if task is not None:
+                pending.add(task)
+            else:
+                missing[key] = t
+
+        if missing:
+            logger.info(
+                "Embedding %d of %d text segments (%d cached or in flight)",
+                len(missing),
+                len(inputs),
+                len(inputs) - len(missing),
+            )
+
+            async def fetch() -> Dict[bytes, np.ndarray]:
+                embeddings = await self._create_embeddings(
+                    list(missing.values()), model
+                )
+                result = dict(zip(missing, embeddings))
+                _embedding_cache.update(result)
+                return result
+
+            def release(_: asyncio.Task) -> None:
+                for key in missing:
+                    self._inflight.pop(("embedding", key), None)
+
+            task = asyncio.ensure_future(fetch())
+            for key in missing:
+                self._inflight[("embedding", key)] = task
+            task.add_done_callback(release)
+            pending.add(task)
+
+        for result in await asyncio.gather(*(asyncio.shield(t) for t in pending)):
+            vectors.update(result)
+        return np.stack([vectors[key] for key in keys])
+
+    async def _create_embeddings(
+        self, texts: List[str], model: str
+    ) -> List[np.ndarray]:
+        """
+        Call the embeddings endpoint, splitting large inputs into concurrent batches.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model to use
 
+        Returns:
+            One float32 vector per text, in input order
+        """
+        # base64 is a quarter of the JSON float payload and decodes straight
+        # into float32 without boxing every component as a Python float
         try:
-            response = await self.client.embeddings.create(
-                input=text,
-                model=model,
-            )
+            client = self.client
+            limiter = self._limiter("embeddings", model)
+
+            if len(texts) <= EmbeddingConfig.BATCH_SIZE:
+                async with limiter:
+                    response = await client.embeddings.create(
+                        input=texts, model=model, encoding_format="base64"
+                    )
+                return [_decode_embedding(item.embedding) for item in response.data]
+
+            batches = [
+                texts[i : i + EmbeddingConfig.BATCH_SIZE]
+                for i in range(0, len(texts), EmbeddingConfig.BATCH_SIZE)
+            ]
+            semaphore = asyncio.Semaphore(EmbeddingConfig.MAX_CONCURRENT_REQUESTS)
 
-            embeddings = [item.embedding for item in response.data]
-            return embeddings
+            async def embed_batch(batch: List[str]):
+                async with semaphore, limiter:
+                    return await client.embeddings.create(
+                        input=batch, model=model, encoding_format="base64"
+                    )
+
+            logger.info("Embedding %d inputs in %d batches", len(texts), len(batches))
+            responses = await asyncio.gather(*(embed_batch(b) for b in batches))
+
+            # gather preserves batch order, so the output lines up with `texts`
+            return [
+                _decode_embedding(item.embedding) for r in responses for item in r.data
+            ]
         except Exception as e:
-            logger.error(f"Unexpected error occurred during embedding: {e}")
+            logger.error("Unexpected error occurred during embedding: %s", e)
             raise
 
     async def response(
@@ -140,9 +534,11 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
         instructions: str,
         model: str = ResponseConfig.DEFAULT_MODEL,
         temperature: float = ResponseConfig.DEFAULT_TEMPERATURE,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        tool_choice: str = ResponseConfig.TOOL_CHOICE_AUTO,
-    ) -> Response:
+        tools: Optional[Sequence[Mapping[str, Any]]] = None,
+        tool_choice: ToolChoice = ResponseConfig.TOOL_CHOICE_AUTO,
+        cache: bool = False,
+        stream: bool = False,
+    ) -> Union[Response, AsyncStream[ResponseStreamEvent]]:
         """
         Generate a response from the AI model.
 
@@ -153,9 +549,14 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
             temperature: Sampling temperature (0.0 to 1.0)
             tools: Optional list of tool definitions
             tool_choice: Tool selection strategy ('auto', 'required', or 'none')
+            cache: Reuse a previous response for a near-identical input with the
+                same model and instructions. Ignored when tools are given.
+            stream: Return an async iterator of response events as soon as the
+                first token is available instead of the finished response.
+                Streamed responses are never cached.
 
         Returns:
-            Response dictionary from the API
+            Response dictionary from the API, or the event stream when `stream` is set
 
         Raises:
             ValueError: If parameters are invalid
@@ -175,19 +576,61 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
             params["temperature"] = temperature
 
         if tools:
-            params["tools"] = tools
+            # Plain dicts for the SDK and the request key; cached tool
+            # definitions are read-only mappings
+            params["tools"] = [dict(tool) for tool in tools]
             params["tool_choice"] = tool_choice
 
-        logger.info(f"Making API call with model: {model}")
+        if stream:
+            logger.info("Making streaming API call with model: %s", model)
+            try:
+                # Only the request itself is throttled, not reading the stream
+                async with self._limiter("responses", model):
+                    return await self.client.responses.create(**params, stream=True)
+            except Exception as e:
+                logger.error("API call failed for model %s: %s", model, e)
+                raise
+
+        semantic_cache = None
+        if cache and not tools:
+            semantic_cache = self._semantic_caches.setdefault(
+                (model, instructions), SemanticResponseCache()
+            )
+            prompt = (
+                user_input
+                if isinstance(user_input, str)
+                else orjson.dumps(user_input).decode("utf-8")
+            )
+            (prompt_embedding,) = await self.text_embedding(
+                prompt, model=SemanticCacheConfig.EMBEDDING_MODEL
+            )
+            cached = semantic_cache.lookup(
+                prompt_embedding, SemanticCacheConfig.SIMILARITY_THRESHOLD
+            )
+            if cached is not None:
+                logger.info("Semantic cache hit for model: %s", model)
+                return cached
+
+        logger.info("Making API call with model: %s", model)
+
+        # Identical concurrent requests share one API call
+        request_key = ("response", orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+
+        async def create() -> Response:
+            async with self._limiter("responses", model):
+                return await self.client.responses.create(**params)
 
         try:
-            response = await self.client.responses.create(**params)
-            logger.debug(f"API call successful for model: {model}")
-            return response
+            response = await self._single_flight(request_key, create)
+            logger.debug("API call successful for model: %s", model)
         except Exception as e:
-            logger.error(f"API call failed for model {model}: {str(e)}")
+            logger.error("API call failed for model %s: %s", model, e)
             raise
 
+        if semantic_cache is not None:
+            semantic_cache.add(prompt_embedding, response)
+        return response
+
     async def structured_response(
         self,
         user_input: Union[str, List[Dict[str, str]]],
@@ -195,7 +638,7 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
         schema_model: Type[BaseModel],
         model: str = ResponseConfig.DEFAULT_MODEL,
         temperature: float = ResponseConfig.DEFAULT_TEMPERATURE,
-        tools: Optional[List[Dict[str, Any]]] = None,
+        tools: Optional[Sequence[Mapping[str, Any]]] = None,
     ) -> Response:
         """
         Generate a structured response conforming to a Pydantic schema.
@@ -214,23 +657,14 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
         Raises:
             ValueError: If schema_model is not a Pydantic BaseModel
         """
-        if not issubclass(schema_model, BaseModel):
+        if tools is None:
+            # Validates schema_model the first time each class is seen
+            tools = _get_schema_tools(schema_model)
+        elif not issubclass(schema_model, BaseModel):
             raise ValueError(
                 f"schema_model must be a Pydantic BaseModel, got {type(schema_model)}"
             )
 
-        if tools is None:
-            schema_name = schema_model.__name__
-            tools = [
-                {
-                    "type": "function",
-                    "name": f"get_{schema_name.lower()}_data",
-                    "description": f"Generate structured data conforming to {schema_name} schema",
-                    "parameters": schema_model.model_json_schema(),
-                },
-            ]
-            logger.debug(f"Auto-generated tool definition for {schema_name}")
-
         return await self.response(
             user_input=user_input,
             instructions=instructions,
@@ -239,3 +673,14 @@ class AsyncOpenAIApiAdapter(AsyncOpenAIAPIPort, metaclass=SingletonABCMeta):
             tools=tools,
             tool_choice=ResponseConfig.TOOL_CHOICE_REQUIRED,
         )
+
+
+@cache
+def get_openai_adapter() -> AsyncOpenAIApiAdapter:
+    """
+    Return the process-wide OpenAI adapter.
+
+    The instance is built on first use and memoised, so hot paths skip the
+    singleton metaclass lock that `AsyncOpenAIApiAdapter()` takes on every call.
+    """
+    return AsyncOpenAIApiAdapter()
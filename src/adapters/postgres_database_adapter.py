@@ -13,68 +13,237 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import json
+import asyncio
 import logging
-import os
+import math
+import struct
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
+import asyncpg
 import numpy as np
+import orjson
 import pandas as pd
-import psycopg2
-from dotenv import load_dotenv
-from psycopg2 import Error, OperationalError, errors
+from asyncpg import exceptions as errors
 
 from src.ports.output import PostgresDatabasePort
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
+# Materialized views refreshed by the scheduler. Each one needs a UNIQUE index
+# so it can be refreshed CONCURRENTLY without blocking readers.
+MATERIALIZED_VIEWS = ("video_stats_view",)
+# Base tables read by the materialized views, used to detect pending changes.
+MATERIALIZED_VIEW_SOURCE_TABLES = (
+    "videos",
+    "VideoLikes",
+    "VideoViews",
+    "VideoShares",
+    "VideoPosts",
+    "Reports",
+)
+
+# Join keys the video_stats_view build and refresh look up in its sources.
+# Built CONCURRENTLY, so each must run on its own outside a transaction.
+VIDEO_STATS_SOURCE_INDEXES = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_video_likes_video_id "
+    'ON "VideoLikes" ("VideoId")',
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_video_views_video_id "
+    'ON "VideoViews" ("VideoId")',
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_video_shares_video_id "
+    'ON "VideoShares" ("VideoId")',
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_video_posts_video_share_id "
+    'ON "VideoPosts" ("VideoShareId")',
+    # Unresolved reports are a small slice of the table
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reports_unresolved_video_id "
+    'ON "Reports" ("VideoId") WHERE "IsResolved" IS FALSE',
+)
+
+# NULL when the index does not exist, false when a CONCURRENTLY build of it
+# was interrupted and left it INVALID
+INDEX_IS_VALID_QUERY = """
+    SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1)
+"""
+
+# Stored as the comment on video_stats_view; bump it whenever the view
+# definition changes. CREATE MATERIALIZED VIEW IF NOT EXISTS keeps an old
+# definition as is, so a view carrying any other comment (views built before
+# the pre-aggregated counts and popularity_score have none) is rebuilt.
+VIDEO_STATS_VIEW_VERSION = "video_stats_view definition v2"
+
+# True when video_stats_view exists but was built from another definition
+VIDEO_STATS_VIEW_IS_STALE_QUERY = """
+    SELECT to_regclass('video_stats_view') IS NOT NULL
+    AND obj_description(to_regclass('video_stats_view'), 'pg_class')
+        IS DISTINCT FROM $1
+"""
+
+REQUIRED_EXTENSIONS = ("vector", "uuid-ossp")
+
+SESSION_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS video_seo_response_history(
+        id uuid DEFAULT uuidv7(),
+        chat_id uuid,
+        temporary_id TEXT DEFAULT null,
+        response JSONB,
+        query Text,
+        created_at TIMESTAMPTZ DEFAULT NOW(),
+        CONSTRAINT video_seo_response_history_pkey PRIMARY KEY (id)
+    );
+"""
+
+TRENDS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS trending_searches (
+        id UUID DEFAULT gen_random_uuid(),
+        representative_query TEXT NOT NULL,
+        representative_query_generated TEXT,
+        trend_score FLOAT NOT NULL,
+        query_count INTEGER NOT NULL,
+        unique_query_count INTEGER NOT NULL,
+        top_queries TEXT,
+        created_at TIMESTAMPTZ NOT NULL,
+        batch_timestamp TIMESTAMPTZ NOT NULL,
+        CONSTRAINT trending_searches_pkey PRIMARY KEY (id)
+    );
+
+    -- Serves both the latest-batch lookup and the per-batch
+    -- ranking in get_current_trends without a sort
+    CREATE INDEX IF NOT EXISTS idx_trending_batch_score
+    ON trending_searches(batch_timestamp DESC, trend_score DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_trending_score 
+    ON trending_searches(trend_score DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_trending_query
+    ON trending_searches(LOWER(representative_query));
+"""
+
+# Upper bound on a single popular-videos lookup
+MAX_POPULAR_VIDEOS = 1000
+
+# Kept constant (limit bound as $1) so asyncpg reuses the prepared statement
+POPULAR_VIDEOS_QUERY = """
+    SELECT video_id
+    FROM video_stats_view
+    ORDER BY popularity_score DESC
+    LIMIT $1;
+"""
+
+
+class VectorIndexConfig:
+    """
+    pgvector index build and search settings for segment embeddings.
+    """
+
+    HNSW_M = 16
+    HNSW_EF_CONSTRUCTION = 64
+    # An HNSW scan returns at most ef_search rows, so the default has to cover
+    # the top_k the search endpoints ask for; larger top_k raise it per query
+    HNSW_EF_SEARCH = 256
+    # pgvector rejects larger values; a top_k above it returns at most this many
+    HNSW_EF_SEARCH_MAX = 1000
+    IVFFLAT_PROBES = 10
+    # Embeddings are stored as FP32 but indexed and scanned at half precision
+    # (pgvector >= 0.7): half the index bytes streamed per search, with the
+    # final ranking recomputed in full precision
+    EMBEDDING_DIM = 1536
+    HALFVEC_EXPRESSION = f"segment_embedding::halfvec({EMBEDDING_DIM})"
+
+    @staticmethod
+    def operator_class(similarity_algorithm: str) -> Tuple[str, str]:
+        """
+        Return the (opclass, index name suffix) serving a similarity metric.
+        Cosine keeps the unsuffixed index names; anything else is searched
+        with `<->` and needs its own L2 index.
+        """
+        if similarity_algorithm == "cosine":
+            return "halfvec_cosine_ops", ""
+        return "halfvec_l2_ops", "_l2"
+
+    @classmethod
+    def server_settings(cls) -> Dict[str, str]:
+        """Session defaults applied to every pooled connection at startup."""
+        return {
+            "hnsw.ef_search": str(cls.HNSW_EF_SEARCH),
+            "ivfflat.probes": str(cls.IVFFLAT_PROBES),
+        }
+
+
+def _json_dumps(value: Any) -> str:
+    """Compact UTF-8 JSON text for JSON/JSONB columns (non-ASCII left unescaped)."""
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode("utf-8")
+
+
+def _encode_vector(value: Any) -> bytes:
+    """Encode an embedding in pgvector's binary format: dim, unused, float4[dim]."""
+    vector = np.asarray(value, dtype=">f4")
+    return struct.pack(">HH", vector.shape[0], 0) + vector.tobytes()
+
+
+def _decode_vector(data: bytes) -> np.ndarray:
+    dim, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f4", count=dim, offset=4).astype(np.float32)
+
 
 class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
-    def __init__(self, conn=None):
-        self.dbname = os.getenv("DATABASE_NAME", os.environ.get("DATABASE_NAME", None))
-        self.host = os.getenv("DATABASE_HOST", os.environ.get("DATABASE_HOST", None))
-        self.port = os.getenv("DATABASE_PORT", os.environ.get("DATABASE_PORT", None))
-        self.user = os.getenv("DATABASE_USER", os.environ.get("DATABASE_USER", None))
-        self.password = os.getenv(
-            "DATABASE_PASSWORD", os.environ.get("DATABASE_PASSWORD", None)
-        )
+    def __init__(self, pool: asyncpg.Pool):
+        """
+        Args:
+            pool (asyncpg.Pool): Shared connection pool; connections are acquired
+                per call and released back to the pool, never closed by the adapter.
+        """
+        self.pool = pool
+        # Tables already ensured by this adapter, so writers skip repeat DDL
+        self._ready_tables: set = set()
 
-        if (
-            not self.dbname
-            or not self.host
-            or not self.port
-            or not self.user
-            or not self.password
-        ):
-            logger.error("Database credentials are not set in environment variables")
-            raise ValueError("Database Credentials not set in environment variables")
+    async def initialize(self) -> None:
+        """
+        Ensure the extensions and the tables written at runtime exist.
 
+        Everything is created on one connection in a single transaction, so
+        startup pays for one commit instead of one per DDL statement.
+        """
         try:
-            self.conn = conn or psycopg2.connect(
-                dbname=self.dbname,
-                user=self.user,
-                password=self.password,
-                host=self.host,
-                port=self.port,
-            )
-            self.cursor = self.conn.cursor()
-            logger.info("Connected to Postgres database")
-        except OperationalError as e:
-            logger.error(f"Could not connect to PostgreSQL: {e}")
-            raise RuntimeError("Database connection failed") from e
-
-        except Error as e:
-            logger.error(f"Some other database error occurred: {e}")
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await self._create_extensions(conn, REQUIRED_EXTENSIONS)
+                    await conn.execute(SESSION_TABLE_DDL)
+                    await conn.execute(TRENDS_TABLE_DDL)
+        except Exception as e:
+            logger.error(f"Failed to initialize database schema: {e}")
             raise
 
-        self._setup_extensions(extension_name=["vector", "uuid-ossp"])
+        self._ready_tables.update(("video_seo_response_history", "trending_searches"))
+        # Connections opened before the vector type existed have no codec for
+        # it; have the pool replace them so every connection registers one
+        await self.pool.expire_connections()
+
+    @staticmethod
+    async def register_vector_codec(conn: asyncpg.Connection) -> None:
+        """
+        Send and receive pgvector values in binary form on this connection.
 
-    def _setup_extensions(self, extension_name: Union[str, List[str]]) -> None:
+        Used as the pool's connection `init` hook. Embeddings are then passed
+        as float arrays, with no text formatting on the client and no text
+        parsing on the server. Does nothing until the vector extension exists.
+        """
+        try:
+            await conn.set_type_codec(
+                "vector",
+                schema="public",
+                encoder=_encode_vector,
+                decoder=_decode_vector,
+                format="binary",
+            )
+        except ValueError:
+            logger.debug("pgvector type not installed yet; codec not registered")
+
+    async def _setup_extensions(self, extension_name: Union[str, List[str]]) -> None:
         """
         Ensure that one or more PostgreSQL extensions are installed for the current
         database connection by executing "CREATE EXTENSION IF NOT EXISTS" for each
@@ -86,67 +255,115 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
 
         Returns:
             None: This method performs side effects on the database (executing SQL
-            statements). On failure, the connection is rolled back and the original
+            statements). On failure, the transaction is rolled back and the original
             exception is re-raised.
         """
         try:
             if isinstance(extension_name, str):
-                self.cursor.execute(
-                    f'CREATE EXTENSION IF NOT EXISTS "{extension_name}";'
-                )
-            else:
-                for extension in extension_name:
-                    self.cursor.execute(
-                        f'CREATE EXTENSION IF NOT EXISTS "{extension}";'
-                    )
+                extension_name = [extension_name]
+
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await self._create_extensions(conn, extension_name)
 
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"Failed to setup extensions: {e}")
             raise
 
+    @staticmethod
+    async def _create_extensions(
+        conn: asyncpg.Connection, extension_names: Iterable[str]
+    ) -> None:
+        """Run CREATE EXTENSION IF NOT EXISTS for each name on `conn`."""
+        for extension in extension_names:
+            await conn.execute(f'CREATE EXTENSION IF NOT EXISTS "{extension}";')
+
     async def create_trends_table(self) -> None:
         """Create trending_searches table if it doesn't exist with all required columns."""
         try:
-            sql = """
-                CREATE TABLE IF NOT EXISTS trending_searches (
-                    id UUID DEFAULT gen_random_uuid(),
-                    representative_query TEXT NOT NULL,
-                    representative_query_generated TEXT,
-                    trend_score FLOAT NOT NULL,
-                    query_count INTEGER NOT NULL,
-                    unique_query_count INTEGER NOT NULL,
-                    top_queries TEXT,
-                    created_at TIMESTAMPTZ NOT NULL,
-                    batch_timestamp TIMESTAMPTZ NOT NULL,
-                    CONSTRAINT trending_searches_pkey PRIMARY KEY (id)
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_trending_batch_timestamp 
-                ON trending_searches(batch_timestamp DESC);
-
-                CREATE INDEX IF NOT EXISTS idx_trending_score 
-                ON trending_searches(trend_score DESC);
-
-                CREATE INDEX IF NOT EXISTS idx_trending_query
-                ON trending_searches(LOWER(representative_query));
-            """
-
-            self.cursor.execute(sql)
-            self.conn.commit()
+            async with self.pool.acquire() as conn:
+                await conn.execute(TRENDS_TABLE_DDL)
+            self._ready_tables.add("trending_searches")
             logger.info("Trending searches table ensured with all columns")
 
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"Error creating trends table: {e}")
             raise
 
+    @staticmethod
+    def _ingest_queries_sql(
+        batch_interval_minutes: Optional[int], max_rows: Optional[int]
+    ) -> Tuple[str, tuple]:
+        """Build the query-history SELECT shared by `ingest_queries` and `iter_queries`.
+
+        The row limit is always a bound parameter (NULL meaning no limit), so
+        each branch is one constant statement whatever `max_rows` is.
+        """
+        if batch_interval_minutes is None:
+            sql = """
+                SELECT 
+                    query,
+                    chat_id,
+                    created_at
+                FROM video_seo_response_history
+                WHERE query IS NOT NULL
+                  AND TRIM(query) != ''
+                ORDER BY created_at DESC
+                LIMIT $1
+            """
+            params = (max_rows,)
+        else:
+            cutoff_time = datetime.now(timezone.utc) - timedelta(
+                minutes=batch_interval_minutes
+            )
+            sql = """
+                SELECT 
+                    query,
+                    chat_id,
+                    created_at
+                FROM video_seo_response_history
+                WHERE created_at >= $1
+                    AND query IS NOT NULL
+                    AND TRIM(query) != ''
+                ORDER BY created_at DESC
+                LIMIT $2
+            """
+            params = (cutoff_time, max_rows)
+
+        return sql, params
+
+    async def iter_queries(
+        self,
+        batch_interval_minutes: Optional[int],
+        max_rows: Optional[int] = None,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream queries from the video_seo_response_history table.
+
+        Same rows and filters as `ingest_queries`, but read through a server-side
+        cursor so the full history is never held in memory at once.
+
+        Args:
+            batch_interval_minutes (Optional[int]): See `ingest_queries`.
+            max_rows (Optional[int]): See `ingest_queries`.
+            prefetch (int): Number of rows fetched from the server per round trip.
+
+        Yields:
+            Dict[str, Any]: Rows with "original_query", "chat_id" and "created_at".
+        """
+        sql, params = self._ingest_queries_sql(batch_interval_minutes, max_rows)
+
+        async with self.pool.acquire() as conn:
+            # Server-side cursors only live inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(sql, *params, prefetch=prefetch):
+                    yield {
+                        "original_query": row[0],
+                        "chat_id": row[1],
+                        "created_at": row[2],
+                    }
+
     async def ingest_queries(
         self, batch_interval_minutes: Optional[int], max_rows: Optional[int] = None
     ) -> List[Dict[str, Any]]:
@@ -182,41 +399,10 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
               minus the given minutes and used as a parameterized query filter.
         """
         try:
-            if batch_interval_minutes is None:
-                sql = """
-                    SELECT 
-                        query,
-                        chat_id,
-                        created_at
-                    FROM video_seo_response_history
-                    WHERE query IS NOT NULL
-                      AND TRIM(query) != ''
-                    ORDER BY created_at DESC
-                """
-                if max_rows is not None:
-                    sql = sql.rstrip() + f"\nLIMIT {int(max_rows)}"
-                params = ()
-            else:
-                cutoff_time = datetime.now(timezone.utc) - timedelta(
-                    minutes=batch_interval_minutes
-                )
-                sql = """
-                    SELECT 
-                        query,
-                        chat_id,
-                        created_at
-                    FROM video_seo_response_history
-                    WHERE created_at >= %s
-                        AND query IS NOT NULL
-                        AND TRIM(query) != ''
-                    ORDER BY created_at DESC
-                """
-                if max_rows is not None:
-                    sql = sql.rstrip() + f"\nLIMIT {int(max_rows)}"
-                params = (cutoff_time,)
+            sql, params = self._ingest_queries_sql(batch_interval_minutes, max_rows)
 
-            self.cursor.execute(sql, params)
-            rows = self.cursor.fetchall()
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(sql, *params)
 
             queries = []
             for row in rows:
@@ -247,7 +433,8 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
     ) -> None:
         """Persist trending search records into `trending_searches`."""
         try:
-            await self.create_trends_table()
+            if "trending_searches" not in self._ready_tables:
+                await self.create_trends_table()
 
             sql = """
                 INSERT INTO trending_searches (
@@ -260,32 +447,32 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
                     created_at,
                     batch_timestamp
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
             """
 
-            for trend in ranked_trends:
-                self.cursor.execute(
-                    sql,
-                    (
-                        trend.get("representative_query"),
-                        trend.get("representative_query_generated"),
-                        float(trend.get("trend_score", 0)),
-                        int(trend.get("query_count", 0)),
-                        int(trend.get("unique_query_count", 0)),
-                        json.dumps(trend.get("top_queries")),
-                        trend.get("created_at"),
-                        batch_timestamp,
-                    ),
+            rows = [
+                (
+                    trend.get("representative_query"),
+                    trend.get("representative_query_generated"),
+                    float(trend.get("trend_score", 0)),
+                    int(trend.get("query_count", 0)),
+                    int(trend.get("unique_query_count", 0)),
+                    _json_dumps(trend.get("top_queries")),
+                    trend.get("created_at"),
+                    batch_timestamp,
                 )
+                for trend in ranked_trends
+            ]
+
+            # executemany pipelines every row through one prepared statement
+            # instead of a round trip per row
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany(sql, rows)
 
-            self.conn.commit()
             logger.info(f"Successfully persisted {len(ranked_trends)} trends")
 
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"Error persisting trends: {e}")
             raise
 
@@ -295,26 +482,30 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
         """Retrieve current trends for the most recent batch_timestamp and format results."""
         try:
             sql = """
-                SELECT 
-                    representative_query,
-                    representative_query_generated,
-                    trend_score,
-                    query_count,
-                    unique_query_count,
-                    top_queries,
-                    created_at,
-                    batch_timestamp
-                FROM trending_searches
-                WHERE batch_timestamp = (
-                    SELECT MAX(batch_timestamp) FROM trending_searches
+                WITH latest AS (
+                    SELECT batch_timestamp
+                    FROM trending_searches
+                    ORDER BY batch_timestamp DESC
+                    LIMIT 1
                 )
-                AND trend_score >= %s
-                ORDER BY trend_score DESC
-                LIMIT %s
+                SELECT 
+                    t.representative_query,
+                    t.representative_query_generated,
+                    t.trend_score,
+                    t.query_count,
+                    t.unique_query_count,
+                    t.top_queries,
+                    t.created_at,
+                    t.batch_timestamp
+                FROM trending_searches t
+                JOIN latest USING (batch_timestamp)
+                WHERE t.trend_score >= $1
+                ORDER BY t.trend_score DESC
+                LIMIT $2
             """
 
-            self.cursor.execute(sql, (min_score, limit))
-            rows = self.cursor.fetchall()
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(sql, min_score, limit)
 
             trends = []
             for row in rows:
@@ -354,8 +545,7 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
             None
         Raises:
             ValueError: If table_name is not one of the supported table names.
-            Exception: If SQL execution fails; the method rolls back the transaction
-                       and re-raises the original exception.
+            Exception: If SQL execution fails; the original exception is re-raised.
         """
 
         try:
@@ -393,63 +583,38 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
             else:
                 raise ValueError(f"Unknown table name: {table_name}")
 
-            self.cursor.execute(table_query)
-            self.conn.commit()
+            async with self.pool.acquire() as conn:
+                await conn.execute(table_query)
             logger.info(f"Table {table_name} created successfully")
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"Failed to create table {table_name}: {e}")
             raise
-        finally:
-            await self.conn.close()
 
     async def create_session_table(
         self,
     ) -> None:
         """Create the video_seo_response_history table if it does not already exist.
         Description:
-            Executes a CREATE TABLE IF NOT EXISTS statement against the adapter's
+            Executes a CREATE TABLE IF NOT EXISTS statement on a pooled
             PostgreSQL connection to ensure the `video_seo_response_history` table is
             present. The intended table contains an `id` UUID column with a default
             generator, a `response` JSONB column, and a primary key constraint on `id`.
-            The method logs the creation attempt, commits the transaction on success,
-            and attempts to rollback on failure before re-raising the exception.
+            The method logs the creation attempt and re-raises any failure.
         Args:
-            self: Adapter instance providing a PostgreSQL connection and cursor
-                (for example, attributes `self.conn` and `self.cursor`). These are used
-                to execute the DDL statement and to commit/rollback the transaction.
+            self: Adapter instance holding the shared connection pool (`self.pool`).
         Returns:
             None
         Raises:
-            Exception: Any exception raised while executing the DDL or committing the
-                transaction is re-raised after an attempted rollback. The exception
-                contains details about the failure.
+            Exception: Any exception raised while executing the DDL is re-raised.
+                The exception contains details about the failure.
         """
 
         try:
-            table_query = """
-                            CREATE TABLE IF NOT EXISTS video_seo_response_history(
-                            id uuid DEFAULT uuidv7(),
-                            chat_id uuid,
-                            temporary_id TEXT DEFAULT null,
-                            response JSONB,
-                            query Text,
-                            created_at TIMESTAMPTZ DEFAULT NOW(),
-                            CONSTRAINT video_seo_response_history_pkey PRIMARY KEY (id)
-                            );
-                        """
-
             logger.info(f"creating table video_seo_response_history ")
-            self.cursor.execute(table_query)
-            self.conn.commit()
+            async with self.pool.acquire() as conn:
+                await conn.execute(SESSION_TABLE_DDL)
+            self._ready_tables.add("video_seo_response_history")
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"Failed to create table : {e}")
             raise
 
@@ -472,43 +637,35 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
         Returns:
             None
         Raises:
-            Exception: If the database insert or commit fails; the method will attempt a rollback
-            and close the connection before re-raising the exception
+            Exception: If the database insert fails; the exception is logged and re-raised
         """
         try:
             logger.info("Inserting responses into database")
 
-            await self.create_session_table()
+            if "video_seo_response_history" not in self._ready_tables:
+                await self.create_session_table()
 
             sql = """
             INSERT INTO video_seo_response_history (
                 chat_id, temporary_id, response, query, created_at
             )
-                VALUES (%s, %s, %s, %s, %s)
+                VALUES ($1, $2, $3, $4, $5)
             """
 
-            self.cursor.execute(
-                sql,
-                (
+            async with self.pool.acquire() as conn:
+                await conn.execute(
+                    sql,
                     chat_id,
                     temporary_id,
-                    json.dumps(response),
+                    _json_dumps(response),
                     query,
                     created_at,
-                ),
-            )
+                )
 
-            self.conn.commit()
             logger.info(f"Inserted response with id {chat_id}")
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"Unable to insert data into table:{e}")
             raise
-        finally:
-            await self.close()
 
     async def bulk_insert_from_parquet(self, parquet_file_path: str | Path) -> None:
         """Bulk insert rows from a Parquet file into the database.
@@ -518,7 +675,9 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
             None: Performs database insertion as a side effect and does not return a value.
         """
         try:
-            df = pd.read_parquet(parquet_file_path)
+            # Parquet decoding and row building are blocking; keep them off
+            # the event loop so searches stay responsive during ingest
+            df = await asyncio.to_thread(pd.read_parquet, parquet_file_path)
             logger.info(f"the filepath is: {parquet_file_path}")
             file_name = Path(parquet_file_path).name
             logger.info(f"Processing file: {file_name}")
@@ -535,6 +694,53 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
             logger.error(f"An unexpected error occurred while inserting data {e}")
             raise
 
+    @staticmethod
+    def _to_vector(emb: Any) -> np.ndarray:
+        """Normalise a list or numpy embedding to a flat float32 array."""
+        if isinstance(emb, np.ndarray) and emb.dtype == object and len(emb) > 0:
+            emb = emb[0]
+        return np.asarray(emb, dtype=np.float32).ravel()
+
+    @classmethod
+    def _embedding_matrix(cls, column: pd.Series) -> np.ndarray:
+        """
+        Normalise a parquet embedding column once into a contiguous (N, D)
+        float32 matrix, whatever nesting or dtype the file stored it with.
+        """
+        if column.empty:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([cls._to_vector(emb) for emb in column])
+
+    @classmethod
+    def _video_segment_rows(cls, df: pd.DataFrame) -> List[Tuple]:
+        """Build `video_segments` COPY records column-wise from a DataFrame."""
+        tenant_ids = df["tenant_id"].tolist() if "tenant_id" in df else [None] * len(df)
+        return list(
+            zip(
+                tenant_ids,
+                df["video_id"].tolist(),
+                df["segment_start_time"].tolist(),
+                df["segment_end_time"].tolist(),
+                df["segment_text"].tolist(),
+                cls._embedding_matrix(df["segment_embedding"]),
+            )
+        )
+
+    @classmethod
+    def _video_rows(cls, df: pd.DataFrame) -> List[Tuple]:
+        """Build `videos` COPY records column-wise from a DataFrame."""
+        return list(
+            zip(
+                df["video_id"].tolist(),
+                df["tenant_id"].tolist(),
+                df["title"].tolist(),
+                df["video_url"].tolist(),
+                map(_json_dumps, df["video_metadata"]),
+                df["video_text"].tolist(),
+                cls._embedding_matrix(df["text_embedding"]),
+            )
+        )
+
     async def _insert_video_segments(self, df: pd.DataFrame) -> None:
         """Insert video segment records from a DataFrame into the video_segments table.
         Args:
@@ -544,58 +750,49 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
                 - segment_start_time: Segment start timestamp/offset.
                 - segment_end_time: Segment end timestamp/offset.
                 - segment_text: Text content of the segment.
-                - segment_embedding: Embedding for the segment (list or numpy array); will be converted to a list
-                  before insertion.
+                - segment_embedding: Embedding for the segment (list or numpy array); sent as a
+                  binary float32 vector.
         Returns:
-            None: Commits inserted rows to the database on success. On failure, attempts to roll back the transaction
-            and re-raises the exception; the method also ensures the database connection is closed.
+            None: Inserts all rows in a single transaction. On failure, the transaction is rolled back
+            and the exception is re-raised.
         """
 
         try:
             logger.info("inserting into video segments table")
 
-            sql = """
-                    INSERT INTO video_segments(
-                    tenant_id, video_id, segment_start_time, segment_end_time, segment_text, segment_embedding 
-                    )
-                    VALUES (%s, %s, %s, %s,%s, %s::vector)
-                """
-
-            for _, row in df.iterrows():
-                logger.debug(type(row["segment_embedding"]))
-                logger.debug(row["segment_embedding"])
-                emb = row["segment_embedding"]
-                if isinstance(emb, np.ndarray):
-                    if emb.dtype == object:
-                        emb = emb[0].tolist() if len(emb) > 0 else emb.tolist()
-                    else:
-                        emb = emb.tolist()
-
-                self.cursor.execute(
-                    sql,
-                    (
-                        row.get("tenant_id"),
-                        row["video_id"],
-                        row["segment_start_time"],
-                        row["segment_end_time"],
-                        row["segment_text"],
-                        emb,
-                    ),
+            # Rows are streamed with binary COPY; embeddings go through the
+            # pool's binary vector codec
+            columns = [
+                "tenant_id",
+                "video_id",
+                "segment_start_time",
+                "segment_end_time",
+                "segment_text",
+                "segment_embedding",
+            ]
+
+            # Once per call, not per row: the old per-row dump of every
+            # embedding dominated ingest time
+            if logger.isEnabledFor(logging.DEBUG) and len(df):
+                logger.debug(
+                    "segment embedding type=%s",
+                    type(df["segment_embedding"].iat[0]).__name__,
                 )
 
-            self.conn.commit()
+            rows = await asyncio.to_thread(self._video_segment_rows, df)
+
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.copy_records_to_table(
+                        "video_segments", records=rows, columns=columns
+                    )
+
             logger.info(f"Inserted {len(df)} video segments")
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(
                 f"An unexpected error occurred during inserting video segments: {e}"
             )
             raise
-        finally:
-            await self.close()
 
     async def _insert_videos(self, df: pd.DataFrame) -> None:
         """Insert rows from the provided DataFrame into the "videos" PostgreSQL table.
@@ -607,51 +804,34 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
                 - video_url: URL of the video
                 - video_metadata: dict-like object (will be JSON-dumped before insertion)
                 - video_text: textual content of the video
-                - text_embedding: list or numpy.ndarray convertible to a Python list (stored as a Postgres vector)
+                - text_embedding: list or numpy.ndarray (sent as a binary float32 Postgres vector)
         Returns:
-            None: Commits the transaction on success; may raise Exceptions on failure.
+            None: Inserts all rows in a single transaction; may raise Exceptions on failure.
 
         """
         try:
             logger.info("Inserting into video table")
-            sql = """
-                    INSERT INTO videos(
-                    id,tenant_id, title, video_url, video_metadata, video_text, text_embedding
+            columns = [
+                "id",
+                "tenant_id",
+                "title",
+                "video_url",
+                "video_metadata",
+                "video_text",
+                "text_embedding",
+            ]
+            rows = await asyncio.to_thread(self._video_rows, df)
+
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.copy_records_to_table(
+                        "videos", records=rows, columns=columns
                     )
-                    VALUES (%s,%s, %s, %s, %s, %s, %s::vector)
-                    """
-            for _, row in df.iterrows():
-                emb = row["text_embedding"]
-                if isinstance(emb, np.ndarray):
-                    if emb.dtype == object:
-                        emb = emb[0].tolist() if len(emb) > 0 else emb.tolist()
-                    else:
-                        emb = emb.tolist()
-
-                self.cursor.execute(
-                    sql,
-                    (
-                        row["video_id"],
-                        row["tenant_id"],
-                        row["title"],
-                        row["video_url"],
-                        json.dumps(row["video_metadata"]),
-                        row["video_text"],
-                        emb,
-                    ),
-                )
 
-            self.conn.commit()
             logger.info(f"Inserted parquet file {len(df)} into table videos")
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"An unexpected error occurred during :{e}")
             raise
-        finally:
-            await self.close()
 
     async def search_similar_vectors(
         self, query_embedding: list[float], top_k=250, similarity_algorithm="cosine"
@@ -659,7 +839,7 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
         """Search for the top-K most similar video segment embeddings to a given query embedding using PostgreSQL (pgvector).
         Args:
             query_embedding (list[float] | numpy.ndarray): The embedding vector to search against the stored segment embeddings.
-            top_k (int, optional): The maximum number of similar results to return. Defaults to 10.
+            top_k (int, optional): The maximum number of similar results to return. Defaults to 250. An HNSW scan returns at most VectorIndexConfig.HNSW_EF_SEARCH_MAX (1000) rows.
             similarity_algorithm (str, optional): Similarity metric to use; "cosine" selects the cosine operator (<=>), otherwise a distance operator (<->) is used. Defaults to "cosine".
         Returns:
             List[Dict[str, Any]]: A list of result dictionaries ordered by increasing distance (more similar first). Each dict contains:
@@ -671,46 +851,63 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
         """
 
         try:
-            if isinstance(query_embedding, np.ndarray):
-                if query_embedding.dtype == object:
-                    query_embedding = (
-                        query_embedding[0].tolist()
-                        if len(query_embedding) > 0
-                        else query_embedding.tolist()
-                    )
-                else:
-                    query_embedding = query_embedding.tolist()
+            query_embedding = self._to_vector(query_embedding)
 
             operator = "<=>" if similarity_algorithm == "cosine" else "<->"
 
+            # The inner ORDER BY matches the halfvec index expression so the
+            # index serves the scan; the outer query re-ranks those candidates
+            # by full-precision distance. The embedding is bound once.
+            halfvec = VectorIndexConfig.HALFVEC_EXPRESSION
+            dim = VectorIndexConfig.EMBEDDING_DIM
             sql = f"""
                     SELECT 
                     video_id,
                     segment_start_time,
                     segment_end_time,
                     segment_text,
-                    segment_embedding {operator} %s::vector AS distance
-                    FROM video_segments
-                    ORDER BY segment_embedding <=> %s::vector ASC
-                    LIMIT %s
+                    segment_embedding {operator} $1::vector AS distance
+                    FROM (
+                        SELECT video_id, segment_start_time, segment_end_time,
+                        segment_text, segment_embedding
+                        FROM video_segments
+                        ORDER BY {halfvec} {operator} $1::vector::halfvec({dim}) ASC
+                        LIMIT $2
+                    ) AS candidates
+                    ORDER BY distance ASC
             """
-            self.cursor.execute(sql, (query_embedding, query_embedding, top_k))
-            rows = self.cursor.fetchall()
-
-            results = []
-            for row in rows:
-                results.append(
-                    {
-                        "video_id": row[0],
-                        "segment_start_time": row[1],
-                        "segment_end_time": row[2],
-                        "segment_text": row[3],
-                        "distance": round(float(row[4]), 4),
-                    }
-                )
-            return results
-
-        except errors.UndefinedTable as e:
+            async with self.pool.acquire() as conn:
+                if top_k <= VectorIndexConfig.HNSW_EF_SEARCH:
+                    rows = await conn.fetch(sql, query_embedding, top_k)
+                else:
+                    # The connection default would truncate the result set
+                    async with conn.transaction():
+                        ef_search = min(top_k, VectorIndexConfig.HNSW_EF_SEARCH_MAX)
+                        await conn.execute(
+                            "SELECT set_config('hnsw.ef_search', $1, true)",
+                            str(ef_search),
+                        )
+                        rows = await conn.fetch(sql, query_embedding, top_k)
+
+            # Round all distances in one vectorised pass rather than per row
+            distances = np.round(
+                np.fromiter(
+                    (row[4] for row in rows), dtype=np.float64, count=len(rows)
+                ),
+                4,
+            ).tolist()
+            return [
+                {
+                    "video_id": str(row[0]),
+                    "segment_start_time": row[1],
+                    "segment_end_time": row[2],
+                    "segment_text": row[3],
+                    "distance": distance,
+                }
+                for row, distance in zip(rows, distances)
+            ]
+
+        except errors.UndefinedTableError as e:
             logger.error(f"Table not found for searching: {e}")
             raise
 
@@ -718,39 +915,116 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
             logger.error(f"An unexpected error occurred: {e}")
             raise
 
-    async def implement_ivfflat_indexing(self):
-        """Create and train an ivfflat index on the video_segments.segment_embedding column using vector_cosine_ops.
+    async def implement_ivfflat_indexing(self, similarity_algorithm: str = "cosine"):
+        """Create and train an ivfflat index on the half-precision video_segments.segment_embedding expression.
+        The full-precision index it supersedes (idx_video_segments{suffix}) is dropped once the halfvec one is valid.
         Args:
-            self: Instance containing 'cursor' (database cursor), 'conn' (database connection) and an async 'close' method; this method executes SQL to create the index, commits on success, and attempts rollback on error.
+            self: Instance holding the shared connection pool; this method executes SQL to create the index and re-raises on error.
+            similarity_algorithm (str, optional): "cosine" builds the halfvec_cosine_ops index, anything else a sibling halfvec_l2_ops index for `<->` searches. Defaults to "cosine".
         Returns:
             None
         """
 
         try:
-            create_index_query = """
-                        CREATE INDEX IF NOT EXISTS idx_video_segments 
+            async with self.pool.acquire() as conn:
+                row_count = await conn.fetchval(
+                    "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class "
+                    "WHERE oid = 'video_segments'::regclass"
+                )
+                # pgvector guidance: rows / 1000 lists up to 1M rows, sqrt(rows) above
+                if row_count <= 1_000_000:
+                    lists = max(1, row_count // 1000)
+                else:
+                    lists = int(math.sqrt(row_count))
+
+                opclass, suffix = VectorIndexConfig.operator_class(similarity_algorithm)
+                create_index_query = f"""
+                        CREATE INDEX IF NOT EXISTS idx_video_segments_halfvec{suffix}
                         ON video_segments 
-                        USING ivfflat (segment_embedding vector_cosine_ops) 
-                        WITH (lists = 100);
+                        USING ivfflat (({VectorIndexConfig.HALFVEC_EXPRESSION}) {opclass}) 
+                        WITH (lists = {lists});
                     """
-            self.cursor.execute(create_index_query)
+                await self._replace_index(
+                    conn,
+                    index_name=f"idx_video_segments_halfvec{suffix}",
+                    create_query=create_index_query,
+                    superseded=f"idx_video_segments{suffix}",
+                )
 
-            self.conn.commit()
             logger.info("Indexing created and trained successfully")
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"An unexpected error occurred: {e}")
             raise
-        finally:
-            await self.close()
+
+    async def create_hnsw_index(self, similarity_algorithm: str = "cosine") -> None:
+        """Create an HNSW index on the half-precision video_segments.segment_embedding expression.
+        HNSW gives better recall per unit of query time than ivfflat and needs no
+        training data, so it can be built on an empty table. The build runs
+        CONCURRENTLY so ingest and search keep working while it runs.
+        The full-precision index it supersedes (idx_video_segments_embedding_hnsw{suffix}) is dropped once the halfvec one is valid.
+        Args:
+            self: Instance holding the shared connection pool; this method executes SQL to create the index and re-raises on error.
+            similarity_algorithm (str, optional): "cosine" builds the halfvec_cosine_ops index, anything else a sibling halfvec_l2_ops index for `<->` searches. Defaults to "cosine".
+        Returns:
+            None
+        """
+
+        try:
+            opclass, suffix = VectorIndexConfig.operator_class(similarity_algorithm)
+            create_index_query = f"""
+                        CREATE INDEX CONCURRENTLY IF NOT EXISTS
+                        idx_video_segments_embedding_hnsw_halfvec{suffix}
+                        ON video_segments
+                        USING hnsw (({VectorIndexConfig.HALFVEC_EXPRESSION}) {opclass})
+                        WITH (
+                            m = {VectorIndexConfig.HNSW_M},
+                            ef_construction = {VectorIndexConfig.HNSW_EF_CONSTRUCTION}
+                        );
+                    """
+            async with self.pool.acquire() as conn:
+                await self._replace_index(
+                    conn,
+                    index_name=f"idx_video_segments_embedding_hnsw_halfvec{suffix}",
+                    create_query=create_index_query,
+                    superseded=f"idx_video_segments_embedding_hnsw{suffix}",
+                )
+
+            logger.info("HNSW index created successfully")
+        except Exception as e:
+            logger.error(f"An unexpected error occurred: {e}")
+            raise
+
+    @staticmethod
+    async def _replace_index(
+        conn: asyncpg.Connection, index_name: str, create_query: str, superseded: str
+    ) -> None:
+        """
+        Build `index_name` with `create_query`, then drop the `superseded` index.
+
+        An INVALID leftover of an interrupted concurrent build would turn
+        CREATE INDEX IF NOT EXISTS into a no-op, so it is dropped and rebuilt.
+        The superseded index is dropped only once the new one is valid, since
+        searches no longer use it.
+
+        Raises:
+            RuntimeError: If the new index is still not valid; the superseded
+                index is kept
+        """
+        if await conn.fetchval(INDEX_IS_VALID_QUERY, index_name) is False:
+            logger.warning(f"Rebuilding invalid index {index_name}")
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+        await conn.execute(create_query)
+
+        if not await conn.fetchval(INDEX_IS_VALID_QUERY, index_name):
+            raise RuntimeError(f"Index {index_name} is not valid; keeping {superseded}")
+        await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {superseded}")
 
     async def create_materialized_video_stat_table(self) -> None:
         """Create a materialized view 'video_stats_view' that aggregates like, view, share, and post counts per video and commits it to the PostgreSQL database.
+        An existing view built from an older definition (see VIDEO_STATS_VIEW_VERSION) is dropped and rebuilt with its indexes in the same transaction.
         Args:
-            self: Instance of the adapter providing an active DB connection and cursor.
+            self: Instance of the adapter holding the shared connection pool.
         Returns:
             None
         """
@@ -759,68 +1033,126 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
             video_stat_query = """
                             create materialized view if not exists video_stats_view
                             as
-                            select v.id as video_id, count(vl."Id") as like_count, count(vv."Id") as view_count,
-                            count(vs."Id") as share_count, count(vp."Id") as post_count
-                            -- select *
+                            select v.id as video_id,
+                            coalesce(vl.like_count, 0) as like_count,
+                            coalesce(vv.view_count, 0) as view_count,
+                            coalesce(vs.share_count, 0) as share_count,
+                            coalesce(vp.post_count, 0) as post_count,
+                            -- Stored so popular-video lookups read the
+                            -- popularity index instead of sorting the view
+                            coalesce(vv.view_count, 0) * 1
+                            + coalesce(vl.like_count, 0) * 10
+                            + coalesce(vs.share_count, 0) * 20 as popularity_score
                             from videos v
-                            left join "VideoLikes" vl on v.id = vl."VideoId" 
-                            left join "VideoViews" vv on v.id = vv."VideoId"
-                            left join "VideoShares" vs on v.id = vs."VideoId"
-                            left join "VideoPosts" vp on vp."VideoShareId" = vs."Id"
-                            where v.id not in (
-                                select vr."VideoId"
+                            -- Each source is counted on its own before joining;
+                            -- joining the raw tables multiplied the counts
+                            left join (
+                                select "VideoId", count(*) as like_count
+                                from "VideoLikes" group by "VideoId"
+                            ) vl on vl."VideoId" = v.id
+                            left join (
+                                select "VideoId", count(*) as view_count
+                                from "VideoViews" group by "VideoId"
+                            ) vv on vv."VideoId" = v.id
+                            left join (
+                                select "VideoId", count(*) as share_count
+                                from "VideoShares" group by "VideoId"
+                            ) vs on vs."VideoId" = v.id
+                            left join (
+                                select s."VideoId", count(*) as post_count
+                                from "VideoPosts" p
+                                join "VideoShares" s on p."VideoShareId" = s."Id"
+                                group by s."VideoId"
+                            ) vp on vp."VideoId" = v.id
+                            -- Anti-join; NOT IN would also drop every video
+                            -- if an unresolved report had a NULL VideoId
+                            where not exists (
+                                select 1
                                 from "Reports" vr
-                                where vr."IsResolved" is false
-                            )
-                            group by v.id;
+                                where vr."VideoId" = v.id
+                                and vr."IsResolved" is false
+                            );
                         """
+            # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+            unique_index_query = """
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_video_stats_view_video_id
+                ON video_stats_view (video_id);
+            """
+            # Covering, so top-K popular videos is an index-only scan
+            popularity_index_query = """
+                CREATE INDEX IF NOT EXISTS idx_video_stats_view_popularity
+                ON video_stats_view (popularity_score DESC) INCLUDE (video_id);
+            """
 
-            logger.info(f"creating table video_seo_response_history ")
-            self.cursor.execute(video_stat_query)
-            self.conn.commit()
+            logger.info(f"creating materialized view video_stats_view")
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    # Serialize concurrent startups so only one rebuilds the view
+                    await conn.execute(
+                        "SELECT pg_advisory_xact_lock(hashtext('video_stats_view'))"
+                    )
+                    if await conn.fetchval(
+                        VIDEO_STATS_VIEW_IS_STALE_QUERY, VIDEO_STATS_VIEW_VERSION
+                    ):
+                        logger.warning(
+                            "video_stats_view has an outdated definition; rebuilding it"
+                        )
+                        await conn.execute("DROP MATERIALIZED VIEW video_stats_view")
+                    await conn.execute(video_stat_query)
+                    await conn.execute(
+                        "COMMENT ON MATERIALIZED VIEW video_stats_view "
+                        f"IS '{VIDEO_STATS_VIEW_VERSION}'"
+                    )
+                    await conn.execute(unique_index_query)
+                    await conn.execute(popularity_index_query)
         except Exception as e:
-            try:
-                self.conn.rollback()
-            except:
-                pass
             logger.error(f"Failed to create table : {e}")
             raise
 
+        await self.create_supporting_indexes()
+
+    async def create_supporting_indexes(self) -> None:
+        """Create the indexes video_stats_view relies on in its source tables.
+        Each index is built CONCURRENTLY so writes to the source tables and
+        running refreshes are not blocked while it builds.
+        Args:
+            self: Instance of the adapter holding the shared connection pool.
+        Returns:
+            None
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                for index_query in VIDEO_STATS_SOURCE_INDEXES:
+                    await conn.execute(index_query)
+            logger.info("video_stats_view supporting indexes created")
+        except Exception as e:
+            logger.error(f"Failed to create supporting indexes: {e}")
+            raise
+
     async def search_popular_videos(self, limit: Optional[int] = 15) -> List:
         """
         Return a list of popular video IDs ordered by a computed popularity score.
         Args:
-            limit (Optional[int]): Maximum number of popular videos to return. If a negative value is provided, the default of 15 is used.
+            limit (Optional[int]): Maximum number of popular videos to return. None or a negative value falls back to the default of 15; larger values are capped at 1000.
         Returns:
             List: A list of video_id values ordered by descending popularity score (computed as view_count * 1 + like_count * 10 + share_count * 20).
         """
 
         try:
-            if limit < 0:
+            if limit is None or limit < 0:
                 limit = 15
+            limit = min(limit, MAX_POPULAR_VIDEOS)
 
-            popular_videos_search_query = f"""
-            SELECT 
-            video_id, 
-            view_count, 
-            like_count, 
-            share_count, 
-            (view_count * 1 + like_count * 10 + share_count * 20) AS popularity_score
-            FROM video_stats_view
-            ORDER BY popularity_score DESC
-            LIMIT {limit};
-            """
             logger.info("Searching popular videos")
 
-            self.cursor.execute(popular_videos_search_query)
-            rows = self.cursor.fetchall()
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(POPULAR_VIDEOS_QUERY, limit)
 
-            results = []
-            for row in rows:
-                results.append(row[0])
-            logger.info("the popular videos are:", results)
+            results = [str(row[0]) for row in rows]
+            logger.info(f"Found {len(results)} popular videos")
             return results
-        except errors.UndefinedTable as e:
+        except errors.UndefinedTableError as e:
             logger.error(f"Table not found for searching: {e}")
             raise
 
@@ -829,40 +1161,88 @@ class AsyncPostgresDatabaseAdapter(PostgresDatabasePort):
             raise
 
     async def refresh_materialized_view_tables(self):
-        """Refresh the 'video_stats_view' materialized view in the connected PostgreSQL database.
+        """Refresh every materialized view in `MATERIALIZED_VIEWS` without blocking readers.
+
+        Each view is refreshed CONCURRENTLY in its own transaction so a failure on
+        one view does not abort the others. A view that has no unique index yet
+        falls back to a plain (locking) refresh.
         Args:
-            self: The adapter instance containing an active DB connection and cursor used to execute the refresh.
+            self: The adapter instance holding the shared connection pool used to execute the refresh.
         Returns:
             None
+        Raises:
+            RuntimeError: If one or more views failed to refresh.
+        """
+
+        failed = []
+        async with self.pool.acquire() as conn:
+            for view_name in MATERIALIZED_VIEWS:
+                started = time.perf_counter()
+                try:
+                    try:
+                        async with conn.transaction():
+                            await conn.execute(
+                                f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name};"
+                            )
+                    except errors.ObjectNotInPrerequisiteStateError:
+                        logger.warning(
+                            f"{view_name} cannot be refreshed concurrently, "
+                            f"falling back to a blocking refresh"
+                        )
+                        async with conn.transaction():
+                            await conn.execute(
+                                f"REFRESH MATERIALIZED VIEW {view_name};"
+                            )
+                    logger.info(
+                        f"Refreshed materialized view {view_name} in "
+                        f"{time.perf_counter() - started:.3f}s"
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to refresh materialized view {view_name}: {e}"
+                    )
+                    failed.append(view_name)
+
+        if failed:
+            raise RuntimeError(
+                f"Failed to refresh materialized views: {', '.join(failed)}"
+            )
+
+    async def get_materialized_view_source_changes(self) -> int:
+        """Return the cumulative number of rows written to the materialized view source tables.
+
+        Reads the insert/update/delete counters from `pg_stat_user_tables`; the
+        caller compares successive values to decide whether a refresh is needed.
+        Args:
+            self: The adapter instance holding the shared connection pool.
+        Returns:
+            int: Sum of inserted, updated and deleted tuples across the source tables.
         """
 
         try:
-            refresh_query = """ REFRESH MATERIALIZED VIEW video_stats_view;"""
-            self.cursor.execute(refresh_query)
-            self.conn.commit()
-        except:
-            try:
-                self.conn.rollback()
-            except:
-                pass
-            logger.error(f"Failed to refresh materialized view")
+            change_query = """
+                SELECT COALESCE(SUM(n_tup_ins + n_tup_upd + n_tup_del), 0)
+                FROM pg_stat_user_tables
+                WHERE relname = ANY($1::text[]);
+            """
+            async with self.pool.acquire() as conn:
+                changes = await conn.fetchval(
+                    change_query, list(MATERIALIZED_VIEW_SOURCE_TABLES)
+                )
+            return int(changes)
+        except Exception as e:
+            logger.error(f"Failed to read materialized view source statistics: {e}")
             raise
 
     async def close(self) -> None:
-        """Close the database connection and associated cursor, releasing resources.
+        """Release adapter-local state.
+        The shared pool is left open for its other users; it is closed only by
+        `infrastructure.db_pool.close_db_pool()` at application shutdown.
         Args:
             None
         Returns:
-            None: This coroutine returns nothing; it completes when the cursor and connection have been closed (may raise an exception if closing fails).
+            None
         """
 
-        try:
-            if self.cursor:
-                self.cursor.close()
-            if self.conn:
-                self.conn.close()
-
-            logger.info("Database connection closed")
-        except Exception as e:
-            logger.error(f"Error closing connection: {e}")
-            raise
+        self._ready_tables.clear()
+        logger.info("Database adapter closed")
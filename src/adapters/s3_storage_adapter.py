@@ -18,8 +18,12 @@ import logging
 import os
 import time
 from pathlib import Path
+from typing import Any, Iterable, List, Tuple
+from weakref import WeakKeyDictionary
 
 import aioboto3
+from aiobotocore.config import AioConfig
+from boto3.s3.transfer import TransferConfig
 from dotenv import load_dotenv
 
 from src.ports.output import S3StoragePort
@@ -32,6 +36,27 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+class S3TransferSettings:
+    """
+    Connection pool and transfer settings for the shared S3 client.
+    """
+
+    MAX_POOL_CONNECTIONS = 64
+    # Objects above the threshold are fetched as concurrent ranged GETs
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+    MAX_CONCURRENCY = 8
+    # Whole objects in flight at once in `download_many`
+    MAX_CONCURRENT_DOWNLOADS = 16
+
+
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=S3TransferSettings.MULTIPART_THRESHOLD,
+    multipart_chunksize=S3TransferSettings.MULTIPART_CHUNKSIZE,
+    max_concurrency=S3TransferSettings.MAX_CONCURRENCY,
+)
+
+
 class S3StorageAdapter(S3StoragePort):
     """Implement the S3 Storage Port to handle S3 interactions asynchronously."""
 
@@ -55,6 +80,27 @@ class S3StorageAdapter(S3StoragePort):
             aws_secret_access_key=self.aws_secret_access_key,
             region_name=self.aws_region,
         )
+        # Created once here rather than on every download
+        VIDEO_DIR.mkdir(parents=True, exist_ok=True)
+        # Kept open for the life of the process, one per event loop
+        self._clients: WeakKeyDictionary = WeakKeyDictionary()
+        self._client_locks: WeakKeyDictionary = WeakKeyDictionary()
+
+    async def _client(self) -> Any:
+        """The S3 client for the running event loop, opened once and reused."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            async with self._client_locks.setdefault(loop, asyncio.Lock()):
+                client = self._clients.get(loop)
+                if client is None:
+                    config = AioConfig(
+                        max_pool_connections=S3TransferSettings.MAX_POOL_CONNECTIONS
+                    )
+                    client = self._clients[loop] = await self.session.client(
+                        "s3", config=config
+                    ).__aenter__()
+        return client
 
     async def download_from_s3(
         self, bucket_name: str, object_key: str
@@ -67,16 +113,36 @@ class S3StorageAdapter(S3StoragePort):
         Returns:
                 tuple[str, float]: A tuple containing the local file path and the time taken to download in seconds
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.info(f"Downloading {object_key} from {bucket_name}")
-        await asyncio.to_thread(VIDEO_DIR.mkdir, parents=True, exist_ok=True)
 
         filename = Path(object_key).name
         local_path = VIDEO_DIR / filename
 
-        async with self.session.client("s3") as s3:
-            await s3.download_file(bucket_name, object_key, str(local_path))
+        s3 = await self._client()
+        await s3.download_file(
+            bucket_name, object_key, str(local_path), Config=_TRANSFER_CONFIG
+        )
+
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"Downloaded {object_key} in {elapsed} seconds.")
+        return local_path, elapsed
+
+    async def download_many(
+        self, bucket_name: str, object_keys: Iterable[str]
+    ) -> List[Tuple[Path, float]]:
+        """
+        Download several objects concurrently over the shared client.
+        Args:
+                bucket_name (str): The name of the S3 bucket.
+                object_keys (Iterable[str]): The keys of the objects to download.
+        Returns:
+                List[tuple[Path, float]]: (local path, seconds taken) per key, in input order
+        """
+        semaphore = asyncio.Semaphore(S3TransferSettings.MAX_CONCURRENT_DOWNLOADS)
+
+        async def _download(object_key: str) -> Tuple[Path, float]:
+            async with semaphore:
+                return await self.download_from_s3(bucket_name, object_key)
 
-        end_time = time.time()
-        logger.info(f"Downloaded {object_key} in {end_time - start_time} seconds.")
-        return local_path, end_time - start_time
+        return list(await asyncio.gather(*(_download(key) for key in object_keys)))
@@ -13,10 +13,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import json
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 from src.application.services.trending_search_service import (
     QueryNormalizationService,
@@ -128,36 +130,18 @@ class TrendingSearchAdapter:
             )
 
             # Optionally generate an LLM-crafted short representative phrase for each trend
-            for trend in ranked_trends:
-                top_qs = trend.get("top_queries")
-                if isinstance(top_qs, str):
-                    try:
-                        parsed = json.loads(top_qs)
-                        if isinstance(parsed, list):
-                            top_qs = parsed
-                        else:
-                            # not a list after parsing; fallback to using representative_query
-                            top_qs = [trend.get("representative_query")]
-                    except Exception:
-                        # fallback: wrap existing string into a single-item list
-                        top_qs = [top_qs]
-
-                if not isinstance(top_qs, list):
-                    top_qs = [str(top_qs)] if top_qs is not None else []
-
-                try:
-                    if len(top_qs) > 0:
-                        rep_obj = await self.representative_service.craft_representative_query(
-                            self.openai_client_port,
-                            [str(q) for q in top_qs],
-                            max_words=4,
-                        )
-                        if rep_obj and hasattr(rep_obj, "query"):
-                            trend["representative_query_generated"] = rep_obj.query
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to generate representative phrase for trend: {e}"
+            phrases = await self._craft_representative_phrases(
+                [
+                    self._parse_top_queries(
+                        trend.get("top_queries"),
+                        fallback=[trend.get("representative_query")],
                     )
+                    for trend in ranked_trends
+                ]
+            )
+            for trend, phrase in zip(ranked_trends, phrases):
+                if phrase:
+                    trend["representative_query_generated"] = phrase
 
             # Persist trends (adapter is responsible for DB schema and inserts)
             batch_timestamp = datetime.now(timezone.utc)
@@ -206,41 +190,26 @@ class TrendingSearchAdapter:
             trends = resp.get("trends", [])
             decorated: List[str] = []
 
-            for trend in trends:
-                # top_queries may be JSON (list) or string
-                top_qs = trend.get("top_queries")
-                if isinstance(top_qs, str):
-                    try:
-                        parsed = json.loads(top_qs)
-                        if isinstance(parsed, list):
-                            top_qs = parsed
-                    except Exception:
-                        top_qs = [top_qs]
-
-                if not isinstance(top_qs, list):
-                    top_qs = [str(top_qs)] if top_qs is not None else []
-
-                # Generate representative phrase via service; fallback to DB representative
-                rep_phrase = ""
-                try:
-                    if len(top_qs) > 0:
-                        rep_obj = await self.representative_service.craft_representative_query(
-                            self.openai_client_port,
-                            [str(q) for q in top_qs],
-                            max_words=4,
-                        )
-                        if rep_obj and hasattr(rep_obj, "query"):
-                            rep_phrase = rep_obj.query
-                except Exception as e:
-                    logger.warning(f"Representative phrase generation failed: {e}")
+            # The batch pipeline already persisted a generated phrase for most
+            # trends; only craft (and parse top_queries) for those without one
+            missing = [
+                trend
+                for trend in trends
+                if not trend.get("representative_query_generated")
+            ]
+            crafted = await self._craft_representative_phrases(
+                [self._parse_top_queries(trend.get("top_queries")) for trend in missing]
+            )
+            generated = {id(trend): phrase for trend, phrase in zip(missing, crafted)}
 
+            for trend in trends:
+                rep_phrase = trend.get(
+                    "representative_query_generated"
+                ) or generated.get(id(trend))
                 if not rep_phrase:
-                    # Use persisted representative phrase if available, otherwise fall back to representative_query
+                    # Fall back to the clustered representative query
                     rep_phrase = (
-                        trend.get("representative_query_generated")
-                        or trend.get("query")
-                        or trend.get("representative_query")
-                        or ""
+                        trend.get("query") or trend.get("representative_query") or ""
                     )
 
                 if isinstance(rep_phrase, str):
@@ -255,6 +224,88 @@ class TrendingSearchAdapter:
             logger.error(f"Error retrieving current trends: {e}")
             return {"status": "error", "trending_searches": [], "error": str(e)}
 
+    @staticmethod
+    def _parse_top_queries(top_qs: Any, fallback: Optional[List] = None) -> List[str]:
+        """
+        Coerce a trend's `top_queries` (JSON text, list or scalar) into strings.
+
+        Args:
+            top_qs: Stored top queries
+            fallback: Used when the JSON text parses to something other than a list
+
+        Returns:
+            List of query strings, empty if there are none
+        """
+        if isinstance(top_qs, str):
+            try:
+                parsed = orjson.loads(top_qs)
+                if isinstance(parsed, list):
+                    top_qs = parsed
+                elif fallback is not None:
+                    top_qs = fallback
+                else:
+                    top_qs = parsed
+            except orjson.JSONDecodeError:
+                # wrap the existing string into a single-item list
+                top_qs = [top_qs]
+
+        if not isinstance(top_qs, list):
+            top_qs = [top_qs] if top_qs is not None else []
+
+        return [str(q) for q in top_qs]
+
+    async def _craft_representative_phrases(
+        self, top_queries_per_trend: List[List[str]]
+    ) -> List[str]:
+        """
+        Craft a representative phrase for every trend concurrently.
+
+        Trends whose top queries normalise to the same set share one call.
+
+        Args:
+            top_queries_per_trend: Top queries of each trend
+
+        Returns:
+            One phrase per trend, in input order; empty where there were no
+            queries or generation failed
+        """
+        normalize = self.normalization_service.normalize_text
+        keys = [
+            tuple(sorted({normalize(q) for q in top_qs}))
+            for top_qs in top_queries_per_trend
+        ]
+        unique: Dict[tuple, List[str]] = {}
+        for key, top_qs in zip(keys, top_queries_per_trend):
+            unique.setdefault(key, top_qs)
+
+        if len(unique) < len(keys):
+            logger.info(
+                f"Crafting {len(unique)} representative phrases for {len(keys)} trends"
+            )
+
+        semaphore = asyncio.Semaphore(self.config.MAX_CONCURRENT_REPRESENTATIVE_CALLS)
+
+        async def craft(top_qs: List[str]) -> str:
+            if not top_qs:
+                return ""
+            try:
+                async with semaphore:
+                    rep_obj = (
+                        await self.representative_service.craft_representative_query(
+                            self.openai_client_port, top_qs, max_words=4
+                        )
+                    )
+                if rep_obj and hasattr(rep_obj, "query"):
+                    return rep_obj.query
+            except Exception as e:
+                logger.warning(f"Representative phrase generation failed: {e}")
+            return ""
+
+        phrases = dict(
+            zip(unique, await asyncio.gather(*(craft(q) for q in unique.values())))
+        )
+        return [phrases[key] for key in keys]
+
     async def _normalize_queries(
         self, raw_queries: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -267,11 +318,11 @@ class TrendingSearchAdapter:
         Returns:
             List of queries with normalized text added
         """
-        for query_data in raw_queries:
-            normalized = await self.normalization_service.normalize(
-                query_data["original_query"]
-            )
-            query_data["query"] = normalized
+        normalized = await self.normalization_service.normalize_many(
+            [query_data["original_query"] for query_data in raw_queries]
+        )
+        for query_data, query in zip(raw_queries, normalized):
+            query_data["query"] = query
 
         return raw_queries
 
@@ -290,8 +341,15 @@ class TrendingSearchAdapter:
             List of query dicts with added 'embedding' field
         """
         try:
-            # Extract unique queries to avoid duplicate embedding calls
-            unique_queries = list(set(q["query"] for q in queries_data))
+            # Extract unique queries (in first-seen order) to avoid duplicate
+            # embedding calls, remembering each one's position
+            query_to_idx: Dict[str, int] = {}
+            unique_queries: List[str] = []
+            for query_data in queries_data:
+                query = query_data["query"]
+                if query not in query_to_idx:
+                    query_to_idx[query] = len(unique_queries)
+                    unique_queries.append(query)
 
             logger.info(
                 f"Vectorizing {len(unique_queries)} unique queries "
@@ -303,14 +361,9 @@ class TrendingSearchAdapter:
                 text=unique_queries, model=self.config.EMBEDDING_MODEL
             )
 
-            # Create embedding lookup
-            query_to_embedding = {
-                query: embedding for query, embedding in zip(unique_queries, embeddings)
-            }
-
             # Attach embeddings to original queries
             for query_data in queries_data:
-                query_data["embedding"] = query_to_embedding[query_data["query"]]
+                query_data["embedding"] = embeddings[query_to_idx[query_data["query"]]]
 
             logger.info(f"Successfully vectorized {len(queries_data)} queries")
             return queries_data
@@ -19,20 +19,46 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from src.domain.models import (
-    SegmentWithVideoIDModel,
-    VideoSegmentModel,
-    VideoSEOResponseModel,
-)
+from cachetools import TTLCache
+
+from src.domain.models import VideoSEOResponseModel
 from src.ports.input import VideoSEOQueryPort
 from src.ports.output import AsyncOpenAIAPIPort, PostgresDatabasePort
 
 logger = logging.getLogger(__name__)
 
 
+class SearchCacheConfig:
+    """
+    Cache of similarity search results for repeated queries.
+
+    Ingest clears it when `clear_search_cache` is wired into
+    `PostgresDatabaseService(on_data_stored=...)` in the same process. Ingest
+    running elsewhere does not, so newly added videos can be missing from a
+    repeated query's results for up to TTL_SECONDS.
+    """
+
+    TTL_SECONDS = 60
+    MAX_SIZE = 1024
+
+
+# Search results carry no per-user data; the session history is still written
+# for every request.
+_search_cache: TTLCache = TTLCache(
+    maxsize=SearchCacheConfig.MAX_SIZE, ttl=SearchCacheConfig.TTL_SECONDS
+)
+
+
+def clear_search_cache() -> None:
+    """Drop every cached search result, e.g. after new segments are ingested."""
+    _search_cache.clear()
+
+
 def group_segments_by_video_id(raw_segments: list):
     """
-    Group raw segment dictionaries by their video_id and convert them into SegmentWithVideoIDModel dictionaries.
+    Group raw segment dictionaries by their video_id into SegmentWithVideoIDModel-shaped dictionaries.
+    Rows come typed from the database, so plain dicts are built directly; the response
+    model still validates the final result once.
     Args:
         raw_segments (list): List of dictionaries representing segments. Each dictionary is expected to include the keys:
             - "video_id" (str | int): Identifier of the video the segment belongs to.
@@ -41,10 +67,10 @@ def group_segments_by_video_id(raw_segments: list):
             - "segment_end_time" (float | int): End time of the segment in seconds.
             - "distance" (float): Distance or relevance score for the segment.
     Returns:
-        list[dict]: A list of dictionaries (as produced by SegmentWithVideoIDModel.model_dump()), where each dictionary
+        list[dict]: A list of dictionaries (shaped as SegmentWithVideoIDModel.model_dump()), where each dictionary
         has the keys:
             - "video_id": The video identifier.
-            - "segments": A list of segment dictionaries (from VideoSegmentModel), each containing
+            - "segments": A list of segment dictionaries (shaped as VideoSegmentModel), each containing
               "segment_text", "segment_start_time", "segment_end_time", and "distance".
     """
 
@@ -52,17 +78,17 @@ def group_segments_by_video_id(raw_segments: list):
         grouped = defaultdict(list)
 
         for item in raw_segments:
-            video_id = item["video_id"]
-            segment_data = {
-                "segment_text": item["segment_text"],
-                "segment_start_time": item["segment_start_time"],
-                "segment_end_time": item["segment_end_time"],
-                "distance": item["distance"],
-            }
-            grouped[video_id].append(VideoSegmentModel(**segment_data))
+            grouped[item["video_id"]].append(
+                {
+                    "segment_text": item["segment_text"],
+                    "segment_start_time": item["segment_start_time"],
+                    "segment_end_time": item["segment_end_time"],
+                    "distance": item["distance"],
+                }
+            )
 
         results = [
-            SegmentWithVideoIDModel(video_id=video_id, segments=segments).model_dump()
+            {"video_id": video_id, "segments": segments}
             for video_id, segments in grouped.items()
         ]
 
@@ -123,32 +149,44 @@ class VideoSEOQueryAdapter(VideoSEOQueryPort):
                     }
                 ).model_dump()
 
-            embeddings = await self.openai_client_port.text_embedding(
-                text=query, model="text-embedding-3-small"
-            )
-
-            if not embeddings:
-                logger.error("No embedding found")
-                return VideoSEOResponseModel.model_validate(
-                    {
-                        "status": "Error",
-                        "results": [],
-                        "error": "Embedding is empty or None",
-                    }
-                ).model_dump()
-            query_embedding = embeddings[0]
-            logger.info("The type of query embeddding is", type(query_embedding))
-
-            results = await self.database_port.search_similar_vectors(
-                query_embedding=query_embedding,
-                top_k=250,
-                similarity_algorithm="cosine",
-            )
+            # Repeated queries within the TTL skip the embedding call and the
+            # vector scan
+            cache_key = " ".join(query.lower().split())
+            results = _search_cache.get(cache_key)
+            if results is not None:
+                logger.debug("Search cache hit for query")
+            else:
+                embeddings = await self.openai_client_port.text_embedding(
+                    text=query, model="text-embedding-3-small"
+                )
+
+                if len(embeddings) == 0:
+                    logger.error("No embedding found")
+                    return VideoSEOResponseModel.model_validate(
+                        {
+                            "status": "Error",
+                            "results": [],
+                            "error": "Embedding is empty or None",
+                        }
+                    ).model_dump()
+                query_embedding = embeddings[0]
+                logger.debug("The type of query embedding is %s", type(query_embedding))
+
+                results = await self.database_port.search_similar_vectors(
+                    query_embedding=query_embedding,
+                    top_k=250,
+                    similarity_algorithm="cosine",
+                )
+                _search_cache[cache_key] = results
+
+            if not results:
+                # Nothing to group, validate or record in the session history
+                return VideoSEOResponseModel().model_dump(exclude_none=True)
 
             grouped_results = group_segments_by_video_id(raw_segments=results)
             if grouped_results:
                 created_time = datetime.now(timezone.utc)
-                logger.debug("The current created utc time is", created_time)
+                logger.debug("The current created utc time is %s", created_time)
                 try:
                     await self.database_port.insert_into_session_table(
                         chat_id=str(chat_id),
@@ -13,17 +13,46 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import logging
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from src.domain.models import VideoDatabaseModel, VideoSegmentDatabaseModel
 from src.ports.output import AsyncOpenAIAPIPort
-from src.utils import extract_audio_from_video, file_exists_and_nonempty, get_media_type
+from src.utils import (
+    choose_cut_points,
+    detect_silences,
+    extract_audio_from_video,
+    file_exists_and_nonempty,
+    get_media_duration,
+    get_media_type,
+    split_audio,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class TranscriptionConfig:
+    """
+    Configuration for chunked audio transcription.
+    """
+
+    MODEL = "whisper-1"
+    # Whisper decodes audio in 30 s windows. Chunks are transcribed
+    # independently, so each loses the preceding text the model would
+    # otherwise condition on; cuts are moved into silences so that at least
+    # no word is split between chunks
+    CHUNK_SECONDS = 30
+    # How far a cut may move from a CHUNK_SECONDS boundary to reach a silence
+    CUT_SEARCH_SECONDS = 5
+    # Shorter files are sent in a single request
+    MIN_DURATION_TO_SPLIT = 60
+    MAX_CONCURRENT_CHUNKS = 8
+
+
 class AudioTranscribeAndEmbedService:
     def __init__(
         self,
@@ -57,6 +86,74 @@ class AudioTranscribeAndEmbedService:
             logger.info("An unexpected error occurred")
             return {"status": "error", "error": "An Unexpected error occurred"}
 
+    async def _transcribe_chunk(
+        self, chunk_path: str, offset: float
+    ) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe one audio chunk and shift its segment timestamps by the
+        chunk's start offset within the original file.
+        """
+        transcript_response = await self.openai_api_port.audio_transcription(
+            audio_path=chunk_path,
+            model=TranscriptionConfig.MODEL,
+            timestamp_granularities=["segment"],
+        )
+        return [
+            (seg.start + offset, seg.end + offset, seg.text)
+            for seg in transcript_response.segments or []
+        ]
+
+    async def _transcribe_segments(
+        self, audio_file_path: str
+    ) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe an audio file, splitting long files into chunks that are
+        transcribed concurrently and merged back in playback order.
+
+        Args:
+                audio_file_path (str): Path to the audio file
+        Returns:
+                list: (start, end, text) tuples with timestamps relative to the full file
+        """
+        duration = await get_media_duration(audio_file_path)
+        if duration is None or duration < TranscriptionConfig.MIN_DURATION_TO_SPLIT:
+            return await self._transcribe_chunk(audio_file_path, 0.0)
+
+        silences = await detect_silences(audio_file_path)
+        cut_points = choose_cut_points(
+            duration,
+            silences,
+            TranscriptionConfig.CHUNK_SECONDS,
+            TranscriptionConfig.CUT_SEARCH_SECONDS,
+        )
+
+        chunk_dir = Path(await asyncio.to_thread(tempfile.mkdtemp, prefix="chunks_"))
+        try:
+            chunks = await split_audio(
+                audio_file_path, chunk_dir, cut_points=cut_points
+            )
+            if not chunks:
+                logger.warning(
+                    f"Could not split {audio_file_path}, transcribing in one request"
+                )
+                return await self._transcribe_chunk(audio_file_path, 0.0)
+
+            logger.info(
+                f"Transcribing {audio_file_path} ({duration:.1f}s) in {len(chunks)} chunks"
+            )
+            semaphore = asyncio.Semaphore(TranscriptionConfig.MAX_CONCURRENT_CHUNKS)
+
+            async def transcribe(chunk_path: str, offset: float):
+                async with semaphore:
+                    return await self._transcribe_chunk(chunk_path, offset)
+
+            results = await asyncio.gather(
+                *(transcribe(path, offset) for path, offset in chunks)
+            )
+            return [segment for chunk_segments in results for segment in chunk_segments]
+        finally:
+            await asyncio.to_thread(shutil.rmtree, chunk_dir, True)
+
     async def _get_transcription(self, audio_file_path: str) -> Dict[str, Any]:
         """
         Generate transcriptions for the given audio file using OpenAI Whisper API.
@@ -68,11 +165,7 @@ class AudioTranscribeAndEmbedService:
         """
 
         try:
-            transcript_response = await self.openai_api_port.audio_transcription(
-                audio_path=audio_file_path,
-                model="whisper-1",
-                timestamp_granularities=["segment"],
-            )
+            segments = await self._transcribe_segments(audio_file_path)
         except Exception as e:
             error_message = f"Failed to get transcription. {e}"
             logger.error(f"{error_message}")
@@ -80,21 +173,21 @@ class AudioTranscribeAndEmbedService:
 
         sentence_segments = [
             {
-                # "start_time": second_converter(seg["start"]),
-                # "end_time": second_converter(seg["end"]),
+                # "start_time": second_converter(seg.start),
+                # "end_time": second_converter(seg.end),
                 "index": i + 1,
-                "start_time": (seg["start"]),
-                "end_time": (seg["end"]),
-                "sentence": seg["text"].strip(),
+                "start_time": start,
+                "end_time": end,
+                "sentence": text.strip(),
             }
-            for i, seg in enumerate(transcript_response.get("segments", []))
+            for i, (start, end, text) in enumerate(segments)
         ]
 
-        logger.info(f"transcribed each segments: {sentence_segments}")
+        # Dumping every segment is only worth the formatting cost when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("transcribed each segments: %s", sentence_segments)
 
-        full_transcription = " ".join(
-            seg["text"].strip() for seg in transcript_response.get("segments", [])
-        )
+        full_transcription = " ".join(seg["sentence"] for seg in sentence_segments)
         return {"full_text": full_transcription, "segments": sentence_segments}
 
     async def _embed_full_text(self, full_transcribed_text: str) -> List:
@@ -111,7 +204,7 @@ class AudioTranscribeAndEmbedService:
             embedded_full_text = await self.openai_api_port.text_embedding(
                 text=full_transcribed_text, model="text-embedding-3-small"
             )
-            return embedded_full_text
+            return embedded_full_text.tolist()
         except Exception as e:
             error_message = f"Failed to get embedding: {e}"
             logger.error(f"{error_message}")
@@ -119,23 +212,29 @@ class AudioTranscribeAndEmbedService:
 
     async def _embed_text_segments(self, segments: List):
         """
-        Generate Embedding of the full transcribed text of the audio.
+        Generate embeddings for every transcribed segment in one batched request.
 
         Args:
-                full_transcribed_text (str): complete text that was transcribed from the video
+                segments (list): transcribed segments, each with a "sentence" key
         Returns:
-                list: List of embedding
+                list: {"index", "embedding"} entries in segment order
         """
         try:
-            embedded_segments = []
-            for idx, seg in enumerate(segments):
-                embedded_segment = await self.openai_api_port.text_embedding(
-                    text=seg.get("sentence"), model="text-embedding-3-small"
-                )
-                if embedded_segment:
-                    embedded_segments.append(
-                        {"index": idx + 1, "embedding": embedded_segment or []}
-                    )
+            if not segments:
+                return []
+
+            # One batched request for every segment instead of one per segment
+            embeddings = await self.openai_api_port.text_embedding(
+                text=[seg.get("sentence") for seg in segments],
+                model="text-embedding-3-small",
+            )
+
+            # Each entry keeps the single-item list shape the per-segment
+            # calls used to return, which the parquet/DB insert path expects
+            embedded_segments = [
+                {"index": idx + 1, "embedding": [embedding.tolist()]}
+                for idx, embedding in enumerate(embeddings)
+            ]
 
             return embedded_segments
 
@@ -144,6 +243,38 @@ class AudioTranscribeAndEmbedService:
             logger.error(f"{error_message}")
             raise RuntimeError(f"Failed to get embeddings: {e}") from e
 
+    async def _embed_transcription(self, transcription: Dict) -> Tuple[List, List]:
+        """
+        Embed the full text and every segment of a transcription in one request.
+
+        Args:
+                transcription (dict): output of `_get_transcription`
+        Returns:
+                tuple: the full-text embedding, shaped as `_embed_full_text`
+                returns it, and the segment entries, shaped as
+                `_embed_text_segments` returns them
+        """
+        try:
+            segments = transcription["segments"]
+            embeddings = await self.openai_api_port.text_embedding(
+                text=[
+                    transcription["full_text"],
+                    *(seg.get("sentence") for seg in segments),
+                ],
+                model="text-embedding-3-small",
+            )
+            embedded_segments = [
+                {"index": idx + 1, "embedding": [embedding.tolist()]}
+                for idx, embedding in enumerate(embeddings[1:])
+            ]
+            # Sliced, not indexed, to keep the (1, D) shape of `_embed_full_text`
+            return embeddings[:1].tolist(), embedded_segments
+
+        except Exception as e:
+            error_message = f"Failed to get embedding: {e}"
+            logger.error(f"{error_message}")
+            raise RuntimeError(f"Failed to get embeddings: {e}") from e
+
     async def process_video(
         self,
         video_path: Path,
@@ -160,9 +291,10 @@ class AudioTranscribeAndEmbedService:
 
         transcription = await self._get_transcription(audio_file_path=audio_path)
 
-        full_text_embedding = await self._embed_full_text(transcription["full_text"])
-        segment_embeddings = await self._embed_text_segments(transcription["segments"])
-        logger.info("The length of segment embedding are", len(segment_embeddings))
+        full_text_embedding, segment_embeddings = await self._embed_transcription(
+            transcription
+        )
+        logger.debug("The length of segment embedding are %d", len(segment_embeddings))
 
         logger.info(f"Completed transcription and embedding for video_id: {video_id}")
 
@@ -15,7 +15,7 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from src.domain.models import VideoSEOResponseModel
 from src.ports.output.postgres_database_port import PostgresDatabasePort
@@ -24,8 +24,20 @@ logger = logging.getLogger(__name__)
 
 
 class PostgresDatabaseService:
-    def __init__(self, database_port: PostgresDatabasePort):
+    def __init__(
+        self,
+        database_port: PostgresDatabasePort,
+        on_data_stored: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            database_port: Database the video data is stored in
+            on_data_stored: Called after each successful ingest; a process that
+                also serves searches passes the query adapter's
+                `clear_search_cache` so new videos show up immediately.
+        """
         self.database_port = database_port
+        self.on_data_stored = on_data_stored
 
     async def initialize_database_schema(self) -> None:
         """Initialize all required database tables"""
@@ -55,6 +67,9 @@ class PostgresDatabaseService:
                 parquet_file_path=parquet_file_path
             )
             logger.info("Successfully stored data from parquet file")
+
+            if self.on_data_stored is not None:
+                self.on_data_stored()
         except Exception as e:
             logger.error(f"Unexpected error occurred while storing parquet file: {e}")
             raise
@@ -76,7 +91,7 @@ class PostgresDatabaseService:
             validated and cleaned (None values excluded).
         """
 
-        if not query_embedding:
+        if query_embedding is None or len(query_embedding) == 0:
             raise ValueError("Query embedding cannot be empty")
 
         if top_k <= 0:
@@ -97,6 +112,6 @@ class PostgresDatabaseService:
         return schema
 
     async def cleanup(self) -> None:
-        """Close database connections and cleanup resources"""
+        """Release the database adapter's resources (the shared pool stays open)"""
         logger.info("Cleaning up service resources")
         await self.database_port.close()
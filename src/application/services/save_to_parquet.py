@@ -19,7 +19,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from src.adapters import AsyncOpenAIApiAdapter
+from src.adapters import get_openai_adapter
 from src.application.services.audio_transcribe_embed_service import (
     AudioTranscribeAndEmbedService,
 )
@@ -32,7 +32,7 @@ PARQUET_DIR = CURR_DIR.parents[2] / "media" / "parquet_files"
 # Create parquet_files directory if not exists
 PARQUET_DIR.mkdir(parents=True, exist_ok=True)
 
-obj = AudioTranscribeAndEmbedService(openai_api_port=AsyncOpenAIApiAdapter())
+obj = AudioTranscribeAndEmbedService(openai_api_port=get_openai_adapter())
 
 
 async def save_video_data(
@@ -47,7 +47,7 @@ async def save_video_data(
     for idx, file_path in enumerate(list_dir):
         video_file = Path(f"{video_dir}/{file_path}")
 
-        logger.debug("len and path in list", len(list_dir), list_dir)
+        logger.debug("len and path in list: %d %s", len(list_dir), list_dir)
         video_id = video_file.stem
         complete_res, segment_res = await obj.process_video(
             video_path=video_file,
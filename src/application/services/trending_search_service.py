@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import hashlib
 import json
 import logging
 from collections import Counter
@@ -20,6 +21,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import numpy as np
+from cachetools import TTLCache
 from sklearn.cluster import DBSCAN
 from sklearn.metrics.pairwise import cosine_distances
 
@@ -42,15 +44,27 @@ class TrendingSearchConfig:
     VOLUME_WEIGHT = 0.6
     RECENCY_WEIGHT = 0.4
     RECENCY_DECAY_MINUTES = 5
+    # Crafted representative phrases are reused for identical top-query sets;
+    # the TTL lets phrases follow the trends as they shift
+    REPRESENTATIVE_CACHE_MAX_SIZE = 1024
+    REPRESENTATIVE_CACHE_TTL_SECONDS = 300
+    # Representative phrases crafted at once per batch or trends request
+    MAX_CONCURRENT_REPRESENTATIVE_CALLS = 8
+
+
+_representative_cache: TTLCache = TTLCache(
+    maxsize=TrendingSearchConfig.REPRESENTATIVE_CACHE_MAX_SIZE,
+    ttl=TrendingSearchConfig.REPRESENTATIVE_CACHE_TTL_SECONDS,
+)
 
 
 class QueryNormalizationService:
     """Service for normalizing and cleaning query text."""
 
     @staticmethod
-    async def normalize(query: str) -> str:
+    def normalize_text(query: str) -> str:
         """
-        Normalize query text for better clustering.
+        Normalize query text without awaiting, for use in synchronous code.
 
         Args:
             query: Raw query string
@@ -69,6 +83,44 @@ class QueryNormalizationService:
 
         return query
 
+    @staticmethod
+    async def normalize(query: str) -> str:
+        """
+        Normalize query text for better clustering.
+
+        Args:
+            query: Raw query string
+
+        Returns:
+            Normalized query string
+        """
+        return QueryNormalizationService.normalize_text(query)
+
+    @staticmethod
+    async def normalize_many(queries: List[str]) -> List[str]:
+        """
+        Normalize a batch of queries in one call.
+
+        Each distinct raw query is normalized once, so repeated queries cost a
+        dict lookup instead of another await.
+
+        Args:
+            queries: Raw query strings
+
+        Returns:
+            Normalized query strings, in the same order as `queries`
+        """
+        normalized: Dict[str, str] = {}
+        result = []
+        for query in queries:
+            value = normalized.get(query)
+            if value is None:
+                value = normalized[query] = QueryNormalizationService.normalize_text(
+                    query
+                )
+            result.append(value)
+        return result
+
 
 class SemanticClusteringService:
     """
@@ -97,19 +149,28 @@ class SemanticClusteringService:
         Returns:
             Dictionary mapping cluster_id to list of query indices
         """
-        try:
-            # Extract embeddings matrix
-            embeddings_matrix = np.array(
-                [q["embedding"] for q in queries_with_embeddings]
-            )
+        # Extract embeddings matrix
+        embeddings_matrix = np.array([q["embedding"] for q in queries_with_embeddings])
+        return await self.cluster_embeddings(embeddings_matrix)
 
-            logger.info(f"Clustering {len(embeddings_matrix)} query vectors")
+    async def cluster_embeddings(self, embeddings: np.ndarray) -> Dict[int, List[int]]:
+        """
+        Apply DBSCAN clustering directly to an (N, D) embeddings matrix.
+
+        Args:
+            embeddings: One embedding per row
+
+        Returns:
+            Dictionary mapping cluster_id to list of row indices
+        """
+        try:
+            logger.info(f"Clustering {len(embeddings)} query vectors")
             logger.info(
                 f"DBSCAN params: eps={self.config.DBSCAN_EPS}, "
                 f"min_samples={self.config.DBSCAN_MIN_SAMPLES}"
             )
 
-            distance_matrix = cosine_distances(embeddings_matrix)
+            distance_matrix = cosine_distances(embeddings)
 
             # Apply DBSCAN
             dbscan = DBSCAN(
@@ -123,7 +184,8 @@ class SemanticClusteringService:
             clusters = {}
             noise_count = 0
 
-            for idx, label in enumerate(cluster_labels):
+            # tolist() yields plain ints, so cluster ids serialize without numpy
+            for idx, label in enumerate(cluster_labels.tolist()):
                 if label == -1:
                     noise_count += 1
                 else:
@@ -320,6 +382,18 @@ class RepresentativeQueryService:
         if not top_queries:
             return RepresentativeQueryModel(query="")
 
+        # The phrase summarises the set, so order and formatting don't matter
+        normalized = sorted(
+            {QueryNormalizationService.normalize_text(q) for q in top_queries}
+        )
+        key_text = "\0".join(
+            [str(model), str(max_words), str(temperature), *normalized]
+        )
+        cache_key = hashlib.blake2b(key_text.encode("utf-8")).digest()
+        cached = _representative_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         instructions = SanitizedQueryPrompt().SANITIZED_QUERY_PROMPT_TEMPLATE.format(
             max_words=max_words
         )
@@ -341,4 +415,6 @@ class RepresentativeQueryService:
             logger.error(f"Failed to parse OpenAI response: {e}")
             raise
 
-        return RepresentativeQueryModel.model_validate(response)
+        representative = RepresentativeQueryModel.model_validate(response)
+        _representative_cache[cache_key] = representative
+        return representative
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -8,9 +9,14 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse, PlainTextResponse
 from strawberry.fastapi import GraphQLRouter
 
-from infrastructure import MaterializedViewRefreshScheduler
+from infrastructure import (
+    MaterializedViewRefreshScheduler,
+    close_db_pool,
+    get_db_adapter,
+    init_db_pool,
+)
 from infrastructure.scheduler import TrendingSearchScheduler
-from src.adapters import AsyncPostgresDatabaseAdapter
+from src.adapters import get_openai_adapter
 from src.adapters.graphql_adapters.query import Query
 
 logger = logging.getLogger(__name__)
@@ -37,7 +43,12 @@ async def lifespan(app: FastAPI):
     logger.info("Application startup: Initializing trending search")
 
     try:
-        _db_adapter = AsyncPostgresDatabaseAdapter()
+        # Open the pool's connections while the OpenAI client is built, so the
+        # first request pays for neither
+        await asyncio.gather(init_db_pool(), get_openai_adapter().warm())
+        _db_adapter = get_db_adapter()
+        await _db_adapter.initialize()
+
         _trending_scheduler = TrendingSearchScheduler(
             interval_minutes=int(os.getenv("INTERVAL_MINUTES", 5))
         )
@@ -48,6 +59,8 @@ async def lifespan(app: FastAPI):
         _mv_scheduler = MaterializedViewRefreshScheduler(
             database_adapter=_db_adapter,
             interval_minutes=int(os.getenv("MATERIALIZED_VIEW_REFRESH_INTERVAL", 15)),
+            min_rows_threshold=int(os.getenv("MATERIALIZED_VIEW_MIN_CHANGED_ROWS", 1)),
+            max_delay_minutes=int(os.getenv("MATERIALIZED_VIEW_MAX_DELAY", 60)),
         )
         _mv_scheduler.start()
         logger.info("Materialized view scheduler initialized")
@@ -67,6 +80,12 @@ async def lifespan(app: FastAPI):
             _mv_scheduler.stop()
         logger.info("Materialized view scheduler stopped")
 
+        await close_db_pool()
+
+        # Only close the OpenAI client if startup got as far as building it
+        if get_openai_adapter.cache_info().currsize:
+            await get_openai_adapter().aclose()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -14,8 +14,19 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
 
+import numpy as np
 from openai.types.audio import TranscriptionVerbose
 from openai.types.responses import Response
 from pydantic import BaseModel
@@ -35,8 +46,12 @@ class AsyncOpenAIAPIPort(ABC):
 
     @abstractmethod
     async def text_embedding(
-        self, text: str | List[Dict[str, Any]], model: str
-    ) -> List[str]:
+        self, text: Union[str, Sequence[str]], model: str
+    ) -> np.ndarray:
+        """Embed one text or a batch of texts.
+
+        Returns a float32 array of shape (N, D), one row per input, in order.
+        """
         pass
 
     @abstractmethod
@@ -46,8 +61,10 @@ class AsyncOpenAIAPIPort(ABC):
         instructions: str,
         model: str,
         temperature: float,
-        tools: Optional[List[Dict[str, Any]]],
+        tools: Optional[Sequence[Mapping[str, Any]]],
         tool_choice: str,
+        cache: bool = False,
+        stream: bool = False,
     ) -> Response:
         pass
 
@@ -59,6 +76,6 @@ class AsyncOpenAIAPIPort(ABC):
         schema_model: Type[BaseModel],
         model: str,
         temperature: float,
-        tools: Optional[List[Dict[str, Any]]],
+        tools: Optional[Sequence[Mapping[str, Any]]],
     ) -> Response:
         pass
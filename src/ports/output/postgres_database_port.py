@@ -16,7 +16,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 
 class PostgresDatabasePort(ABC):
@@ -43,7 +43,7 @@ class PostgresDatabasePort(ABC):
 
     @abstractmethod
     async def close(self) -> None:
-        """Close database connection"""
+        """Release adapter resources; the shared connection pool stays open"""
         pass
 
     @abstractmethod
@@ -81,6 +81,16 @@ class PostgresDatabasePort(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_queries(
+        self,
+        batch_interval_minutes: Optional[int],
+        max_rows: Optional[int] = None,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the same rows as `ingest_queries` without materializing them."""
+        pass
+
     @abstractmethod
     async def persist_trends(
         self, trends: List[Dict[str, Any]], batch_timestamp: datetime
@@ -100,6 +110,11 @@ class PostgresDatabasePort(ABC):
         """Ensure the `materialized_video_stat` table exists."""
         pass
 
+    @abstractmethod
+    async def create_supporting_indexes(self) -> None:
+        """Ensure the source-table indexes used by the materialized view exist."""
+        pass
+
     @abstractmethod
     async def search_popular_videos(self, limit: Optional[int] = 15) -> List:
         """Search for popular videos."""
@@ -111,3 +126,8 @@ class PostgresDatabasePort(ABC):
     @abstractmethod
     async def refresh_materialized_view_tables(self):
         pass
+
+    @abstractmethod
+    async def get_materialized_view_source_changes(self) -> int:
+        """Return a monotonically growing write counter for the materialized view sources."""
+        pass
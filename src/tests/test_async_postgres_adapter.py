@@ -16,15 +16,22 @@
 import asyncio
 import json
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import numpy as np
 import pandas as pd
 import pytest
-from psycopg2 import Error, OperationalError
+from asyncpg import exceptions as errors
 
-from src.adapters import AsyncPostgresDatabaseAdapter
+import infrastructure.db_pool as db_pool
+from src.adapters import AsyncPostgresDatabaseAdapter, VectorIndexConfig
+from src.adapters.postgres_database_adapter import (
+    VIDEO_STATS_VIEW_VERSION,
+    _decode_vector,
+    _encode_vector,
+)
 
 
 @pytest.fixture
@@ -37,47 +44,79 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("DATABASE_PASSWORD", "test_password")
 
 
+@pytest.fixture
+def reset_pool(monkeypatch):
+    """Ensure every test starts without a shared pool."""
+    monkeypatch.setattr(db_pool, "_pool", None)
+    monkeypatch.setattr(db_pool, "_db_adapter", None)
+
+
 @pytest.fixture
 def mock_connection():
-    """Create a mock database connection and cursor."""
+    """Create a mock pooled connection."""
     mock_conn = MagicMock()
-    mock_conn.close = AsyncMock()
-    mock_conn.commit = MagicMock()  #
-    mock_conn.roll_back = MagicMock()
-    mock_cursor = MagicMock()
-    mock_cursor.execute = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    return mock_conn, mock_cursor
+    mock_conn.execute = AsyncMock()
+    mock_conn.executemany = AsyncMock()
+    mock_conn.copy_records_to_table = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[])
+    mock_conn.fetchval = AsyncMock(return_value=None)
+    return mock_conn
+
+
+@pytest.fixture
+def mock_pool(mock_connection):
+    """Create a mock pool whose acquire() yields the mock connection."""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = mock_connection
+    pool.close = AsyncMock()
+    return pool
 
 
 @pytest.fixture
-def adapter(mock_env_vars, mock_connection):
-    mock_conn, mock_cursor = mock_connection
-    adapter = AsyncPostgresDatabaseAdapter(conn=mock_conn)
-    adapter.conn = mock_conn
-    adapter.cursor = mock_cursor
+def adapter(mock_pool, mock_connection):
+    adapter = AsyncPostgresDatabaseAdapter(pool=mock_pool)
+    adapter.conn = mock_connection
     return adapter
 
 
 class TestInitialization:
-    """Test suite for adapter initialization."""
+    """Test suite for pool and adapter initialization."""
 
-    def test_initialization_success(self, mock_env_vars):
-        """Test successful initialization with valid credentials."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+    @pytest.mark.asyncio
+    async def test_initialization_success(self, mock_env_vars, reset_pool):
+        """Test successful pool initialization with valid credentials."""
+        mock_pool = MagicMock()
+
+        with patch(
+            "asyncpg.create_pool", new=AsyncMock(return_value=mock_pool)
+        ) as create_pool:
+            pool = await db_pool.init_db_pool()
+
+        assert pool is mock_pool
+        assert db_pool.get_db_pool() is mock_pool
+        kwargs = create_pool.call_args.kwargs
+        assert kwargs["database"] == "test_db"
+        assert kwargs["host"] == "localhost"
+        assert kwargs["port"] == "5432"
+        assert kwargs["user"] == "test_user"
+        assert kwargs["password"] == "test_password"
+        assert kwargs["min_size"] == db_pool.PoolConfig.MIN_SIZE
+        assert kwargs["max_size"] == db_pool.PoolConfig.MAX_SIZE
 
-        with patch("psycopg2.connect", return_value=mock_conn):
-            adapter = AsyncPostgresDatabaseAdapter()
+    @pytest.mark.asyncio
+    async def test_initialization_is_idempotent(self, mock_env_vars, reset_pool):
+        """Test the pool is only created once."""
+        with patch(
+            "asyncpg.create_pool", new=AsyncMock(return_value=MagicMock())
+        ) as create_pool:
+            first = await db_pool.init_db_pool()
+            second = await db_pool.init_db_pool()
 
-            assert adapter.dbname == "test_db"
-            assert adapter.host == "localhost"
-            assert adapter.port == "5432"
-            assert adapter.user == "test_user"
-            assert adapter.password == "test_password"
+        assert first is second
+        create_pool.assert_awaited_once()
 
-    def test_initialization_missing_credentials(self, monkeypatch):
+    @pytest.mark.asyncio
+    async def test_initialization_missing_credentials(self, monkeypatch, reset_pool):
         """Test initialization fails when credentials are missing."""
         monkeypatch.delenv("DATABASE_NAME", raising=False)
         monkeypatch.delenv("DATABASE_HOST", raising=False)
@@ -86,42 +125,113 @@ class TestInitialization:
         monkeypatch.delenv("DATABASE_PASSWORD", raising=False)
 
         with pytest.raises(ValueError, match="Database Credentials not set"):
-            AsyncPostgresDatabaseAdapter()
+            await db_pool.init_db_pool()
 
-    def test_initialization_connection_failure(self, mock_env_vars):
+    @pytest.mark.asyncio
+    async def test_initialization_connection_failure(self, mock_env_vars, reset_pool):
         """Test initialization handles connection failures."""
         with patch(
-            "psycopg2.connect", side_effect=OperationalError("Connection failed")
+            "asyncpg.create_pool",
+            new=AsyncMock(side_effect=ConnectionRefusedError("Connection failed")),
         ):
             with pytest.raises(RuntimeError, match="Database connection failed"):
-                AsyncPostgresDatabaseAdapter()
+                await db_pool.init_db_pool()
+
+    def test_get_pool_before_init(self, reset_pool):
+        """Test accessing the pool before initialization fails loudly."""
+        with pytest.raises(RuntimeError, match="not initialized"):
+            db_pool.get_db_pool()
+
+    @pytest.mark.asyncio
+    async def test_get_db_adapter_uses_shared_pool(self, mock_env_vars, reset_pool):
+        """Test adapters handed out by the dependency share the pool."""
+        mock_pool = MagicMock()
+
+        with patch("asyncpg.create_pool", new=AsyncMock(return_value=mock_pool)):
+            await db_pool.init_db_pool()
+
+        assert db_pool.get_db_adapter().pool is mock_pool
+        assert db_pool.get_db_adapter() is db_pool.get_db_adapter()
+
+
+class TestVectorCodec:
+    """Test suite for the binary pgvector codec."""
+
+    def test_encode_decode_round_trip(self):
+        """Test embeddings survive the pgvector binary wire format."""
+        embedding = [0.25, -1.5, 3.0]
+        data = _encode_vector(embedding)
+
+        # int16 dimension, int16 unused, then big-endian float4 values
+        assert data[:4] == b"\x00\x03\x00\x00"
+        assert len(data) == 4 + 4 * len(embedding)
+        decoded = _decode_vector(data)
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(decoded, embedding)
+
+    @pytest.mark.asyncio
+    async def test_register_vector_codec_without_extension(self):
+        """Test registration is skipped while the vector type does not exist."""
+        conn = MagicMock()
+        conn.set_type_codec = AsyncMock(side_effect=ValueError("unknown type"))
+
+        await AsyncPostgresDatabaseAdapter.register_vector_codec(conn)
+
+        assert conn.set_type_codec.call_args.kwargs["format"] == "binary"
 
 
 class TestExtensionSetup:
     """Test suite for extension setup."""
 
-    def test_setup_single_extension(self, adapter):
+    @pytest.mark.asyncio
+    async def test_setup_single_extension(self, adapter):
         """Test setting up a single extension."""
-        adapter._setup_extensions("vector")
-        adapter.cursor.execute.assert_called_with(
+        await adapter._setup_extensions("vector")
+        adapter.conn.execute.assert_called_with(
             'CREATE EXTENSION IF NOT EXISTS "vector";'
         )
 
-    def test_setup_multiple_extensions(self, adapter):
+    @pytest.mark.asyncio
+    async def test_setup_multiple_extensions(self, adapter):
         """Test setting up multiple extensions."""
-        adapter._setup_extensions(["vector", "uuid-ossp"])
+        await adapter._setup_extensions(["vector", "uuid-ossp"])
 
-        calls = adapter.cursor.execute.call_args_list
+        calls = adapter.conn.execute.call_args_list
         assert len(calls) >= 2
 
-    def test_setup_extensions_failure(self, adapter):
+    @pytest.mark.asyncio
+    async def test_setup_extensions_failure(self, adapter):
         """Test extension setup handles failures."""
-        adapter.cursor.execute.side_effect = Exception("Extension error")
+        adapter.conn.execute.side_effect = Exception("Extension error")
 
         with pytest.raises(Exception, match="Extension error"):
-            adapter._setup_extensions("invalid_extension")
+            await adapter._setup_extensions("invalid_extension")
+
+        # The transaction block saw the exception and rolled back
+        exc_type = adapter.conn.transaction.return_value.__aexit__.call_args[0][0]
+        assert exc_type is Exception
+
 
-        adapter.conn.rollback.assert_called()
+class TestInitialize:
+    """Test suite for startup schema setup."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_runs_ddl_in_one_transaction(self, adapter):
+        """Test extensions and startup tables share one connection and commit."""
+        adapter.pool.expire_connections = AsyncMock()
+
+        await adapter.initialize()
+
+        adapter.pool.acquire.assert_called_once()
+        adapter.conn.transaction.assert_called_once()
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        assert any("video_seo_response_history" in sql for sql in statements)
+        assert any("trending_searches" in sql for sql in statements)
+        assert adapter._ready_tables == {
+            "video_seo_response_history",
+            "trending_searches",
+        }
+        adapter.pool.expire_connections.assert_awaited_once()
 
 
 class TestCreateTable:
@@ -133,21 +243,19 @@ class TestCreateTable:
         await adapter.create_table("videos")
 
         # Verify SQL was executed
-        adapter.cursor.execute.assert_called()
-        call_args = adapter.cursor.execute.call_args[0][0]
+        adapter.conn.execute.assert_called()
+        call_args = adapter.conn.execute.call_args[0][0]
         assert "CREATE TABLE IF NOT EXISTS videos" in call_args
         assert "text_embedding VECTOR(1536)" in call_args
-        adapter.conn.commit.assert_called()
 
     @pytest.mark.asyncio
     async def test_create_video_segments_table(self, adapter):
         """Test creating video_segments table."""
         await adapter.create_table("video_segments")
 
-        call_args = adapter.cursor.execute.call_args[0][0]
+        call_args = adapter.conn.execute.call_args[0][0]
         assert "CREATE TABLE IF NOT EXISTS video_segments" in call_args
         assert "segment_embedding VECTOR(1536)" in call_args
-        adapter.conn.commit.assert_called()
 
     @pytest.mark.asyncio
     async def test_create_table_invalid_name(self, adapter):
@@ -158,12 +266,17 @@ class TestCreateTable:
     @pytest.mark.asyncio
     async def test_create_table_failure(self, adapter):
         """Test table creation handles failures."""
-        adapter.cursor.execute.side_effect = Exception("SQL error")
+        adapter.conn.execute.side_effect = Exception("SQL error")
 
         with pytest.raises(Exception, match="SQL error"):
             await adapter.create_table("videos")
 
-        adapter.conn.rollback.assert_called()
+    @pytest.mark.asyncio
+    async def test_create_table_keeps_pool_open(self, adapter):
+        """Test table creation does not close the shared pool."""
+        await adapter.create_table("videos")
+
+        adapter.pool.close.assert_not_called()
 
 
 class TestCreateSessionTable:
@@ -174,21 +287,18 @@ class TestCreateSessionTable:
         """Test creating session table successfully."""
         await adapter.create_session_table()
 
-        call_args = adapter.cursor.execute.call_args[0][0]
+        call_args = adapter.conn.execute.call_args[0][0]
         assert "CREATE TABLE IF NOT EXISTS video_seo_response_history" in call_args
         assert "response JSONB" in call_args
-        adapter.conn.commit.assert_called()
 
     @pytest.mark.asyncio
     async def test_create_session_table_failure(self, adapter):
         """Test session table creation handles failures."""
-        adapter.cursor.execute.side_effect = Exception("Table creation failed")
+        adapter.conn.execute.side_effect = Exception("Table creation failed")
 
         with pytest.raises(Exception):
             await adapter.create_session_table()
 
-        adapter.conn.rollback.assert_called()
-
 
 class TestInsertIntoSessionTable:
     """Test suite for inserting into session table."""
@@ -202,24 +312,59 @@ class TestInsertIntoSessionTable:
         ]
 
         with patch.object(adapter, "create_session_table") as mock_create:
-            with patch.object(adapter, "close") as mock_close:
-                await adapter.insert_into_session_table(test_response)
+            await adapter.insert_into_session_table(
+                chat_id="8f14e45f-ceea-467f-a0e6-7a5d0c6d5b3e",
+                response=test_response,
+                query="test",
+                created_at=datetime.now(timezone.utc),
+            )
 
         mock_create.assert_called_once()
-        adapter.cursor.execute.assert_called()
-        adapter.conn.commit.assert_called()
+        adapter.conn.execute.assert_called()
+        assert json.loads(adapter.conn.execute.call_args[0][3]) == test_response
+        adapter.pool.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insert_session_data_compact_utf8_json(self, adapter):
+        """Test responses are stored as compact JSON without ASCII escaping."""
+        await adapter.insert_into_session_table(
+            chat_id="8f14e45f-ceea-467f-a0e6-7a5d0c6d5b3e",
+            response=[{"query": "café"}],
+            query="café",
+            created_at=datetime.now(timezone.utc),
+        )
+
+        assert adapter.conn.execute.call_args[0][3] == '[{"query":"café"}]'
+
+    @pytest.mark.asyncio
+    async def test_insert_session_data_creates_table_once(self, adapter):
+        """Test the table DDL is only issued by the first insert."""
+        for _ in range(3):
+            await adapter.insert_into_session_table(
+                chat_id="8f14e45f-ceea-467f-a0e6-7a5d0c6d5b3e",
+                response=[],
+                query="test",
+                created_at=datetime.now(timezone.utc),
+            )
+
+        ddl_calls = [
+            c for c in adapter.conn.execute.call_args_list if "CREATE TABLE" in c[0][0]
+        ]
+        assert len(ddl_calls) == 1
 
     @pytest.mark.asyncio
     async def test_insert_session_data_failure(self, adapter):
         """Test insert handles failures."""
-        adapter.cursor.execute.side_effect = Exception("Insert failed")
+        adapter.conn.execute.side_effect = Exception("Insert failed")
 
         with patch.object(adapter, "create_session_table"):
-            with patch.object(adapter, "close"):
-                with pytest.raises(Exception):
-                    await adapter.insert_into_session_table([{"test": "data"}])
-
-        adapter.conn.rollback.assert_called()
+            with pytest.raises(Exception):
+                await adapter.insert_into_session_table(
+                    chat_id="8f14e45f-ceea-467f-a0e6-7a5d0c6d5b3e",
+                    response=[{"test": "data"}],
+                    query="test",
+                    created_at=datetime.now(timezone.utc),
+                )
 
 
 class TestBulkInsertFromParquet:
@@ -285,11 +430,18 @@ class TestInsertVideoSegments:
             }
         )
 
-        with patch.object(adapter, "close"):
-            await adapter._insert_video_segments(test_df)
+        await adapter._insert_video_segments(test_df)
 
-        assert adapter.cursor.execute.call_count == 4
-        adapter.conn.commit.assert_called()
+        adapter.conn.copy_records_to_table.assert_called_once()
+        call = adapter.conn.copy_records_to_table.call_args
+        assert call[0][0] == "video_segments"
+        assert call[1]["columns"][-1] == "segment_embedding"
+        rows = call[1]["records"]
+        assert len(rows) == 2
+        assert rows[1][:2] == ("tenant2", "video2")
+        assert rows[1][5].dtype == np.float32
+        np.testing.assert_allclose(rows[1][5], [0.2] * 1536)
+        adapter.conn.transaction.assert_called()
 
     @pytest.mark.asyncio
     async def test_insert_video_segments_with_object_dtype(self, adapter):
@@ -305,11 +457,12 @@ class TestInsertVideoSegments:
             }
         )
 
-        with patch.object(adapter, "close"):
-            await adapter._insert_video_segments(test_df)
+        await adapter._insert_video_segments(test_df)
 
-        adapter.cursor.execute.assert_called()
-        adapter.conn.commit.assert_called()
+        rows = adapter.conn.copy_records_to_table.call_args[1]["records"]
+        assert rows[0][5].shape == (1536,)
+        np.testing.assert_allclose(rows[0][5], [0.1] * 1536)
+        adapter.conn.transaction.assert_called()
 
 
 class TestInsertVideos:
@@ -332,10 +485,39 @@ class TestInsertVideos:
 
         await adapter._insert_videos(test_df)
 
-        adapter.cursor.execute.assert_called()
+        adapter.conn.copy_records_to_table.assert_called_once()
         # Check that JSON was dumped
-        call_args = adapter.cursor.execute.call_args[0][1]
-        assert isinstance(call_args[4], str)
+        (row,) = adapter.conn.copy_records_to_table.call_args[1]["records"]
+        assert json.loads(row[4]) == {"duration": 100}
+
+
+class TestPersistTrends:
+    """Test suite for persisting trends."""
+
+    @pytest.mark.asyncio
+    async def test_persist_trends_single_batch(self, adapter):
+        """Test that all trends are written in one executemany call."""
+        batch_timestamp = datetime.now(timezone.utc)
+        trends = [
+            {
+                "representative_query": f"query {i}",
+                "trend_score": i,
+                "query_count": 3,
+                "unique_query_count": 2,
+                "top_queries": "[('query', 3)]",
+                "created_at": batch_timestamp,
+            }
+            for i in range(3)
+        ]
+
+        with patch.object(adapter, "create_trends_table", AsyncMock()):
+            await adapter.persist_trends(trends, batch_timestamp)
+
+        adapter.conn.executemany.assert_called_once()
+        rows = adapter.conn.executemany.call_args[0][1]
+        assert len(rows) == 3
+        assert rows[2][2] == 2.0
+        assert rows[2][7] == batch_timestamp
 
 
 class TestSearchSimilarVectors:
@@ -347,7 +529,7 @@ class TestSearchSimilarVectors:
         query_embedding = [0.1] * 1536
 
         # Mock database response
-        adapter.cursor.fetchall.return_value = [
+        adapter.conn.fetch.return_value = [
             ("video1", 0.0, 10.0, "segment text", 0.1234),
             ("video2", 10.0, 20.0, "another segment", 0.2345),
         ]
@@ -362,25 +544,320 @@ class TestSearchSimilarVectors:
         assert results[0]["distance"] == 0.1234
 
         # Verify correct operator was used
-        call_args = adapter.cursor.execute.call_args[0][0]
+        call_args = adapter.conn.fetch.call_args[0][0]
         assert "<=>" in call_args
 
+    @pytest.mark.asyncio
+    async def test_search_similar_vectors_euclidean_orders_by_same_operator(
+        self, adapter
+    ):
+        """Test the ORDER BY uses the requested distance operator."""
+        await adapter.search_similar_vectors(
+            [0.1] * 1536, top_k=2, similarity_algorithm="euclidean"
+        )
+
+        sql, *params = adapter.conn.fetch.call_args[0]
+        assert "segment_embedding <-> $1::vector AS distance" in sql
+        assert "halfvec(1536) <-> $1::vector::halfvec(1536)" in sql
+        assert "<=>" not in sql
+        # The embedding is bound once and shared by SELECT and ORDER BY
+        assert len(params) == 2
+        assert params[1] == 2
+
+    @pytest.mark.asyncio
+    async def test_search_similar_vectors_raises_ef_search_for_large_top_k(
+        self, adapter
+    ):
+        """Test a top_k above the HNSW default widens ef_search for that query."""
+        top_k = VectorIndexConfig.HNSW_EF_SEARCH + 1
+
+        await adapter.search_similar_vectors([0.1] * 1536, top_k=top_k)
+
+        adapter.conn.execute.assert_awaited_once_with(
+            "SELECT set_config('hnsw.ef_search', $1, true)", str(top_k)
+        )
+        adapter.conn.transaction.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_search_similar_vectors_caps_ef_search(self, adapter):
+        """Test ef_search never exceeds the pgvector maximum."""
+        top_k = VectorIndexConfig.HNSW_EF_SEARCH_MAX + 500
+
+        await adapter.search_similar_vectors([0.1] * 1536, top_k=top_k)
+
+        adapter.conn.execute.assert_awaited_once_with(
+            "SELECT set_config('hnsw.ef_search', $1, true)",
+            str(VectorIndexConfig.HNSW_EF_SEARCH_MAX),
+        )
+        assert adapter.conn.fetch.call_args[0][2] == top_k
+
+
+class TestVectorIndexes:
+    """Test suite for pgvector index creation."""
+
+    @pytest.mark.asyncio
+    async def test_hnsw_index_defaults_to_cosine(self, adapter):
+        """Test the default HNSW index is a cosine index on the halfvec expression."""
+        adapter.conn.fetchval.return_value = True
+
+        await adapter.create_hnsw_index()
+
+        sql = adapter.conn.execute.call_args_list[0][0][0]
+        assert "CONCURRENTLY" in sql
+        assert "idx_video_segments_embedding_hnsw_halfvec\n" in sql
+        assert "halfvec_cosine_ops" in sql
+
+    @pytest.mark.asyncio
+    async def test_hnsw_index_l2_sibling(self, adapter):
+        """Test euclidean search gets its own vector_l2_ops index."""
+        adapter.conn.fetchval.return_value = True
+
+        await adapter.create_hnsw_index(similarity_algorithm="euclidean")
+
+        sql = adapter.conn.execute.call_args_list[0][0][0]
+        assert "idx_video_segments_embedding_hnsw_halfvec_l2" in sql
+        assert "halfvec_l2_ops" in sql
+
+    @pytest.mark.asyncio
+    async def test_hnsw_index_drops_full_precision_index(self, adapter):
+        """Test the superseded full-precision HNSW index is dropped after the build."""
+        adapter.conn.fetchval.return_value = True
+
+        await adapter.create_hnsw_index()
+
+        adapter.conn.execute.assert_awaited_with(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_video_segments_embedding_hnsw"
+        )
+
+    @pytest.mark.asyncio
+    async def test_ivfflat_index_drops_full_precision_index(self, adapter):
+        """Test the superseded full-precision ivfflat index is dropped after the build."""
+        adapter.conn.fetchval.side_effect = [5000, True, True]
+
+        await adapter.implement_ivfflat_indexing(similarity_algorithm="euclidean")
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        assert "idx_video_segments_halfvec_l2" in statements[0]
+        assert "lists = 5" in statements[0]
+        assert (
+            statements[1] == "DROP INDEX CONCURRENTLY IF EXISTS idx_video_segments_l2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalid_halfvec_index_is_rebuilt(self, adapter):
+        """Test an INVALID leftover of a failed concurrent build is rebuilt first."""
+        adapter.conn.fetchval.side_effect = [False, True]
+
+        await adapter.create_hnsw_index()
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        assert statements[0] == (
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "idx_video_segments_embedding_hnsw_halfvec"
+        )
+        assert "CREATE INDEX CONCURRENTLY" in statements[1]
+        assert statements[2] == (
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_video_segments_embedding_hnsw"
+        )
+
+    @pytest.mark.asyncio
+    async def test_superseded_index_kept_when_build_is_invalid(self, adapter):
+        """Test the old index is not dropped while the new one is not valid."""
+        adapter.conn.fetchval.side_effect = [None, False]
+
+        with pytest.raises(RuntimeError):
+            await adapter.create_hnsw_index()
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        assert len(statements) == 1
+        assert "CREATE INDEX CONCURRENTLY" in statements[0]
+
+
+class TestSearchPopularVideos:
+    """Test suite for popular video search."""
+
+    @pytest.mark.asyncio
+    async def test_limit_is_bound_parameter(self, adapter):
+        """Test the limit is bound so the statement text stays constant."""
+        adapter.conn.fetch.return_value = [("video1",), ("video2",)]
+
+        results = await adapter.search_popular_videos(limit=2)
+
+        assert results == ["video1", "video2"]
+        sql, limit = adapter.conn.fetch.call_args[0]
+        assert "LIMIT $1" in sql
+        assert limit == 2
+
+    @pytest.mark.asyncio
+    async def test_negative_limit_uses_default(self, adapter):
+        """Test negative limits fall back to the default."""
+        await adapter.search_popular_videos(limit=-1)
+
+        assert adapter.conn.fetch.call_args[0][1] == 15
+
+    @pytest.mark.asyncio
+    async def test_none_limit_uses_default_and_large_limit_is_capped(self, adapter):
+        """Test a None limit falls back to the default and huge limits are capped."""
+        await adapter.search_popular_videos(limit=None)
+        assert adapter.conn.fetch.call_args[0][1] == 15
+
+        await adapter.search_popular_videos(limit=10**6)
+        assert adapter.conn.fetch.call_args[0][1] == 1000
+
+
+class TestCreateMaterializedVideoStatTable:
+    """Test suite for the video stats materialized view."""
+
+    @pytest.mark.asyncio
+    async def test_view_uses_anti_join_and_preaggregated_counts(self, adapter):
+        """Test reports are anti-joined and counts are not fanned out."""
+        await adapter.create_materialized_video_stat_table()
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        view_sql = next(sql for sql in statements if "materialized view" in sql)
+        assert "not exists" in view_sql
+        assert "not in" not in view_sql
+        assert view_sql.count("group by") == 4
+        assert any('"Reports" ("VideoId") WHERE' in sql for sql in statements)
+
+    @pytest.mark.asyncio
+    async def test_supporting_indexes_built_concurrently(self, adapter):
+        """Test source indexes are built CONCURRENTLY outside a transaction."""
+        adapter.conn.transaction.reset_mock()
+
+        await adapter.create_supporting_indexes()
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        assert len(statements) == 5
+        assert all("CREATE INDEX CONCURRENTLY" in sql for sql in statements)
+        adapter.conn.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_view_stores_indexed_popularity_score(self, adapter):
+        """Test the popularity score is materialized and indexed for top-K reads."""
+        await adapter.create_materialized_video_stat_table()
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        assert any("as popularity_score" in sql for sql in statements)
+        assert any(
+            "(popularity_score DESC) INCLUDE (video_id)" in sql for sql in statements
+        )
+
+    @pytest.mark.asyncio
+    async def test_outdated_view_is_rebuilt(self, adapter):
+        """Test a view from an older definition is dropped and recreated."""
+        adapter.conn.fetchval.return_value = True
+
+        await adapter.create_materialized_video_stat_table()
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        drop_at = statements.index("DROP MATERIALIZED VIEW video_stats_view")
+        create_at = next(
+            i for i, sql in enumerate(statements) if "materialized view if" in sql
+        )
+        assert "pg_advisory_xact_lock" in statements[0]
+        assert drop_at < create_at
+        assert any("idx_video_stats_view_popularity" in sql for sql in statements)
+        assert any(
+            "COMMENT ON MATERIALIZED VIEW" in sql and VIDEO_STATS_VIEW_VERSION in sql
+            for sql in statements
+        )
+        assert adapter.conn.fetchval.call_args[0][1] == VIDEO_STATS_VIEW_VERSION
+
+    @pytest.mark.asyncio
+    async def test_current_view_is_kept(self, adapter):
+        """Test an up-to-date view is not dropped."""
+        await adapter.create_materialized_video_stat_table()
+
+        statements = [c[0][0] for c in adapter.conn.execute.call_args_list]
+        assert not any("DROP MATERIALIZED VIEW" in sql for sql in statements)
+
+
+class TestRefreshMaterializedViews:
+    """Test suite for materialized view refresh."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_concurrently(self, adapter):
+        """Test views are refreshed without blocking readers."""
+        await adapter.refresh_materialized_view_tables()
+
+        call_args = adapter.conn.execute.call_args[0][0]
+        assert "REFRESH MATERIALIZED VIEW CONCURRENTLY video_stats_view" in call_args
+
+    @pytest.mark.asyncio
+    async def test_refresh_falls_back_without_unique_index(self, adapter):
+        """Test a plain refresh is used when a concurrent one is not possible."""
+        adapter.conn.execute.side_effect = [
+            errors.ObjectNotInPrerequisiteStateError("no unique index"),
+            None,
+        ]
+
+        await adapter.refresh_materialized_view_tables()
+
+        call_args = adapter.conn.execute.call_args[0][0]
+        assert "REFRESH MATERIALIZED VIEW video_stats_view" in call_args
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure(self, adapter):
+        """Test refresh failures are reported after all views were attempted."""
+        adapter.conn.execute.side_effect = Exception("Refresh failed")
+
+        with pytest.raises(RuntimeError, match="video_stats_view"):
+            await adapter.refresh_materialized_view_tables()
+
+
+class TestIterQueries:
+    """Test suite for streaming query history."""
+
+    @pytest.mark.asyncio
+    async def test_iter_queries_streams_rows(self, adapter):
+        """Test rows are read through a server-side cursor."""
+
+        async def cursor_rows():
+            yield ("first query", "chat-1", "2025-01-01")
+            yield ("second query", "chat-2", "2025-01-02")
+
+        adapter.conn.cursor = MagicMock(return_value=cursor_rows())
+
+        rows = [r async for r in adapter.iter_queries(None, max_rows=2)]
+
+        assert [r["original_query"] for r in rows] == ["first query", "second query"]
+        sql, limit = adapter.conn.cursor.call_args[0]
+        assert "LIMIT $1" in sql
+        assert limit == 2
+        adapter.conn.transaction.assert_called()
+
+
+class TestMaterializedViewSourceChanges:
+    """Test suite for materialized view change detection."""
+
+    @pytest.mark.asyncio
+    async def test_source_changes(self, adapter):
+        """Test the write counter is read for every source table."""
+        adapter.conn.fetchval = AsyncMock(return_value=42)
+
+        changes = await adapter.get_materialized_view_source_changes()
+
+        assert changes == 42
+        assert "pg_stat_user_tables" in adapter.conn.fetchval.call_args[0][0]
+        assert "VideoLikes" in adapter.conn.fetchval.call_args[0][1]
+
 
 class TestClose:
     """Test suite for closing connections."""
 
     @pytest.mark.asyncio
-    async def test_close_connection(self, adapter):
-        """Test closing connection and cursor."""
+    async def test_close_leaves_shared_pool_open(self, adapter):
+        """Test closing the adapter does not close the shared pool."""
         await adapter.close()
 
-        adapter.cursor.close.assert_called()
-        adapter.conn.close.assert_called()
+        adapter.pool.close.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_close_with_error(self, adapter):
-        """Test close handles errors."""
-        adapter.cursor.close.side_effect = Exception("Close failed")
+    async def test_close_forgets_ready_tables(self, adapter):
+        """Test closing the adapter drops its table bookkeeping."""
+        adapter._ready_tables.add("video_seo_response_history")
 
-        with pytest.raises(Exception):
-            await adapter.close()
+        await adapter.close()
+
+        assert adapter._ready_tables == set()
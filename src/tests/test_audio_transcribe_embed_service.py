@@ -0,0 +1,126 @@
+# Copyright (C) 2025 Veel Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from src.application.services import audio_transcribe_embed_service
+from src.application.services.audio_transcribe_embed_service import (
+    AudioTranscribeAndEmbedService,
+    TranscriptionConfig,
+)
+
+
+def fake_embeddings(text, model):
+    """Return one deterministic row per input text, as the OpenAI adapter does."""
+    texts = [text] if isinstance(text, str) else text
+    return np.array([[float(len(t)), float(i)] for i, t in enumerate(texts)])
+
+
+@pytest.mark.asyncio
+async def test_embed_transcription_matches_separate_calls():
+    """Test the single-request embedding keeps the shapes of the separate calls."""
+    openai_port = AsyncMock()
+    openai_port.text_embedding.side_effect = fake_embeddings
+    service = AudioTranscribeAndEmbedService(openai_api_port=openai_port)
+    transcription = {
+        "full_text": "hello world again",
+        "segments": [{"sentence": "hello world"}, {"sentence": "again"}],
+    }
+
+    full_text, segments = await service._embed_transcription(transcription)
+
+    expected_full_text = await service._embed_full_text(transcription["full_text"])
+    expected_segments = await service._embed_text_segments(transcription["segments"])
+    assert full_text == expected_full_text
+    assert [s["index"] for s in segments] == [s["index"] for s in expected_segments]
+    assert [np.shape(s["embedding"]) for s in segments] == [
+        np.shape(s["embedding"]) for s in expected_segments
+    ]
+    assert segments[0]["embedding"] == [[11.0, 1.0]]
+
+
+def fake_transcription(delays):
+    """Transcribe each chunk as one 1-2 s segment named after the chunk."""
+
+    async def transcribe(audio_path, model, timestamp_granularities):
+        await asyncio.sleep(delays.get(audio_path, 0))
+        return SimpleNamespace(
+            segments=[SimpleNamespace(start=1.0, end=2.0, text=audio_path)]
+        )
+
+    return transcribe
+
+
+@pytest.mark.asyncio
+async def test_chunk_timestamps_are_shifted_by_chunk_offsets():
+    """Test chunk segments are moved to file time and merged in playback order."""
+    openai_port = AsyncMock()
+    # The first chunk finishes last, so completion order differs from playback
+    openai_port.audio_transcription.side_effect = fake_transcription({"c0": 0.01})
+    service = AudioTranscribeAndEmbedService(openai_api_port=openai_port)
+    chunks = [("c0", 0.0), ("c1", 31.25), ("c2", 58.5)]
+
+    with (
+        patch.object(
+            audio_transcribe_embed_service,
+            "get_media_duration",
+            AsyncMock(return_value=80.0),
+        ),
+        patch.object(
+            audio_transcribe_embed_service,
+            "detect_silences",
+            AsyncMock(return_value=[(31.0, 31.5), (58.0, 59.0)]),
+        ),
+        patch.object(
+            audio_transcribe_embed_service,
+            "split_audio",
+            AsyncMock(return_value=chunks),
+        ) as split_audio,
+    ):
+        segments = await service._transcribe_segments("talk.mp3")
+
+    assert segments == [
+        (1.0, 2.0, "c0"),
+        (32.25, 33.25, "c1"),
+        (59.5, 60.5, "c2"),
+    ]
+    assert split_audio.call_args.kwargs["cut_points"] == [31.25, 58.5]
+
+
+@pytest.mark.asyncio
+async def test_short_audio_is_transcribed_in_one_request():
+    """Test files below the split threshold are not chunked."""
+    openai_port = AsyncMock()
+    openai_port.audio_transcription.side_effect = fake_transcription({})
+    service = AudioTranscribeAndEmbedService(openai_api_port=openai_port)
+    duration = TranscriptionConfig.MIN_DURATION_TO_SPLIT - 1
+
+    with (
+        patch.object(
+            audio_transcribe_embed_service,
+            "get_media_duration",
+            AsyncMock(return_value=duration),
+        ),
+        patch.object(audio_transcribe_embed_service, "split_audio") as split_audio,
+    ):
+        segments = await service._transcribe_segments("clip.mp3")
+
+    assert segments == [(1.0, 2.0, "clip.mp3")]
+    split_audio.assert_not_called()
@@ -0,0 +1,78 @@
+# Copyright (C) 2025 Veel Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import choose_cut_points, detect_silences, split_audio
+from src.utils import helpers
+
+
+class TestChooseCutPoints:
+    """Test suite for silence-aligned chunk boundaries."""
+
+    def test_cuts_move_to_nearest_silence(self):
+        """Test each boundary snaps to the middle of a nearby silence."""
+        silences = [(28.0, 29.0), (62.0, 63.0)]
+
+        assert choose_cut_points(90.0, silences, 30, 5) == [28.5, 62.5]
+
+    def test_cuts_fall_back_to_chunk_length(self):
+        """Test boundaries stay at chunk_seconds without a silence in range."""
+        silences = [(10.0, 11.0)]
+
+        assert choose_cut_points(70.0, silences, 30, 5) == [30.0, 60.0]
+
+    def test_short_audio_is_not_cut(self):
+        assert choose_cut_points(25.0, [], 30, 5) == []
+
+
+@pytest.mark.asyncio
+async def test_detect_silences_parses_ffmpeg_log():
+    log = (
+        "[silencedetect @ 0x1] silence_start: -0.01\n"
+        "[silencedetect @ 0x1] silence_end: 0.8 | silence_duration: 0.81\n"
+        "[silencedetect @ 0x1] silence_start: 29.5\n"
+        "[silencedetect @ 0x1] silence_end: 30.25 | silence_duration: 0.75\n"
+    )
+    result = {"status": "success", "output": "", "log": log, "error": None}
+
+    with patch.object(helpers, "run_ffmpeg_command", return_value=result):
+        silences = await detect_silences("talk.mp3")
+
+    assert silences == [(0.0, 0.8), (29.5, 30.25)]
+
+
+@pytest.mark.asyncio
+async def test_split_audio_reads_quoted_segment_names(tmp_path):
+    """Test chunk names with commas, which ffmpeg quotes, are parsed intact."""
+
+    async def fake_split(command):
+        (tmp_path / "segments.csv").write_text(
+            '"talk, part_0000.mp3",0.000000,29.982000\n'
+            '"talk, part_0001.mp3",29.982000,55.000000\n'
+        )
+        return {"status": "success", "output": "", "log": "", "error": None}
+
+    with patch.object(helpers, "run_ffmpeg_command", side_effect=fake_split) as run:
+        chunks = await split_audio("talk, part.mp3", tmp_path, cut_points=[30.0])
+
+    assert chunks == [
+        (str(tmp_path / "talk, part_0000.mp3"), 0.0),
+        (str(tmp_path / "talk, part_0001.mp3"), 29.982),
+    ]
+    command = run.call_args[0][0]
+    assert command[command.index("-segment_times") + 1] == "30.000"
@@ -0,0 +1,227 @@
+# Copyright (C) 2025 Veel Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import base64
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from cachetools import LRUCache
+
+from src.adapters import openai_adapter
+from src.adapters.openai_adapter import (
+    AsyncOpenAIApiAdapter,
+    SemanticCacheConfig,
+    SemanticResponseCache,
+    _decode_embedding,
+)
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """A fresh adapter, bypassing the process-wide singleton."""
+    monkeypatch.setattr(openai_adapter, "_OPENAI_API_KEY", "test-key")
+    instance = AsyncOpenAIApiAdapter.__new__(AsyncOpenAIApiAdapter)
+    instance.__init__()
+    return instance
+
+
+def encode(vector) -> str:
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode()
+
+
+def vector_for(text: str) -> np.ndarray:
+    return np.array([len(text), 1.0, 0.0], dtype=np.float32)
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Stub the OpenAI client; embeddings encode each text's length."""
+
+    async def create_embeddings(input, model, encoding_format):
+        await asyncio.sleep(0)
+        return SimpleNamespace(
+            data=[SimpleNamespace(embedding=encode(vector_for(t))) for t in input]
+        )
+
+    async def create_response(**params):
+        await asyncio.sleep(0)
+        return SimpleNamespace(output_text=f"reply to {params['input']}")
+
+    client = SimpleNamespace(
+        embeddings=SimpleNamespace(create=AsyncMock(side_effect=create_embeddings)),
+        responses=SimpleNamespace(create=AsyncMock(side_effect=create_response)),
+    )
+    monkeypatch.setattr(AsyncOpenAIApiAdapter, "client", property(lambda _: client))
+    monkeypatch.setattr(openai_adapter, "_embedding_cache", LRUCache(maxsize=16))
+    return client
+
+
+class TestClient:
+    """Test suite for the per-loop OpenAI client."""
+
+    @pytest.mark.asyncio
+    async def test_warm_builds_the_loop_client_once(self, adapter):
+        """Test warm() builds the client that later requests reuse."""
+        await adapter.warm()
+        client = adapter.client
+
+        await adapter.warm()
+
+        assert adapter.client is client
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_rebuilt_after_aclose(self, adapter):
+        """Test a closed client is replaced on next use."""
+        await adapter.warm()
+        client = adapter.client
+
+        await adapter.aclose()
+
+        assert adapter.client is not client
+        await adapter.aclose()
+
+
+class TestTextEmbedding:
+    """Test suite for embedding caching and request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_inputs_are_sent_once(self, adapter, fake_client):
+        """Test repeated texts in one batch trigger one API call with one copy each."""
+        result = await adapter.text_embedding(["a", "bb", "a"])
+
+        fake_client.embeddings.create.assert_awaited_once()
+        assert fake_client.embeddings.create.await_args.kwargs["input"] == ["a", "bb"]
+        np.testing.assert_array_equal(
+            result, np.stack([vector_for("a"), vector_for("bb"), vector_for("a")])
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_inputs_skip_the_api(self, adapter, fake_client):
+        """Test only texts missing from the cache are sent on a later call."""
+        await adapter.text_embedding(["a", "bb"])
+
+        result = await adapter.text_embedding(["bb", "ccc"])
+
+        assert fake_client.embeddings.create.await_count == 2
+        assert fake_client.embeddings.create.await_args.kwargs["input"] == ["ccc"]
+        np.testing.assert_array_equal(
+            result, np.stack([vector_for("bb"), vector_for("ccc")])
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(
+        self, adapter, fake_client
+    ):
+        """Test a text already in flight is awaited rather than re-sent."""
+        first, second = await asyncio.gather(
+            adapter.text_embedding("a"), adapter.text_embedding("a")
+        )
+
+        fake_client.embeddings.create.assert_awaited_once()
+        np.testing.assert_array_equal(first, second)
+        assert not adapter._inflight
+
+    @pytest.mark.asyncio
+    async def test_hits_survive_eviction_during_the_call(
+        self, adapter, fake_client, monkeypatch
+    ):
+        """Test a cache hit is kept even if the fetch evicts it from the LRU."""
+        monkeypatch.setattr(openai_adapter, "_embedding_cache", LRUCache(maxsize=1))
+        await adapter.text_embedding("a")
+
+        result = await adapter.text_embedding(["a", "bb"])
+
+        np.testing.assert_array_equal(
+            result, np.stack([vector_for("a"), vector_for("bb")])
+        )
+
+    def test_decode_embedding_round_trip(self):
+        """Test base64 payloads decode to read-only float32 vectors."""
+        vector = _decode_embedding(encode([0.5, -1.25, 3.0]))
+
+        assert vector.dtype == np.float32
+        np.testing.assert_array_equal(vector, [0.5, -1.25, 3.0])
+        assert not vector.flags.writeable
+
+
+class TestSemanticResponseCache:
+    """Test suite for the nearest-neighbour response cache."""
+
+    def test_lookup_at_threshold(self):
+        """Test hits at or above the threshold and misses below it."""
+        cache = SemanticResponseCache()
+        cache.add(np.array([1.0, 0.0]), "cached")
+        angle = np.arccos(SemanticCacheConfig.SIMILARITY_THRESHOLD)
+
+        near = np.array([np.cos(angle * 0.9), np.sin(angle * 0.9)])
+        far = np.array([np.cos(angle * 1.1), np.sin(angle * 1.1)])
+
+        assert cache.lookup(near, SemanticCacheConfig.SIMILARITY_THRESHOLD) == "cached"
+        assert cache.lookup(far, SemanticCacheConfig.SIMILARITY_THRESHOLD) is None
+
+    def test_empty_cache_misses(self):
+        """Test an empty cache never returns a response."""
+        assert SemanticResponseCache().lookup(np.array([1.0, 0.0]), 0.0) is None
+
+    def test_oldest_entry_is_overwritten(self):
+        """Test the ring buffer replaces the oldest entry once full."""
+        cache = SemanticResponseCache(max_entries=2)
+        cache.add(np.array([1.0, 0.0, 0.0]), "first")
+        cache.add(np.array([0.0, 1.0, 0.0]), "second")
+        cache.add(np.array([0.0, 0.0, 1.0]), "third")
+
+        assert cache.lookup(np.array([1.0, 0.0, 0.0]), 0.99) is None
+        assert cache.lookup(np.array([0.0, 1.0, 0.0]), 0.99) == "second"
+        assert cache.lookup(np.array([0.0, 0.0, 1.0]), 0.99) == "third"
+
+
+class TestResponse:
+    """Test suite for response() coalescing and semantic caching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(
+        self, adapter, fake_client
+    ):
+        """Test identical in-flight requests are sent to the API once."""
+        first, second = await asyncio.gather(
+            adapter.response("hello", "be brief"),
+            adapter.response("hello", "be brief"),
+        )
+
+        fake_client.responses.create.assert_awaited_once()
+        assert first is second
+        assert not adapter._inflight
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_reuses_similar_prompt(self, adapter, fake_client):
+        """Test a cached response is returned for a near-identical prompt."""
+        first = await adapter.response("hello", "be brief", cache=True)
+        # Same length, so the stubbed embedding is identical
+        second = await adapter.response("howdy", "be brief", cache=True)
+
+        fake_client.responses.create.assert_awaited_once()
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_is_scoped_to_instructions(self, adapter, fake_client):
+        """Test responses are not reused across different instructions."""
+        await adapter.response("hello", "be brief", cache=True)
+        await adapter.response("hello", "be verbose", cache=True)
+
+        assert fake_client.responses.create.await_count == 2
@@ -0,0 +1,55 @@
+# Copyright (C) 2025 Veel Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.services import PostgresDatabaseService
+
+
+@pytest.mark.asyncio
+async def test_store_video_data_notifies_after_ingest(tmp_path):
+    """Test the on_data_stored hook runs once the data is stored."""
+    parquet_file = tmp_path / "segment_video.parquet"
+    parquet_file.write_bytes(b"data")
+    database_port = AsyncMock()
+    on_data_stored = MagicMock()
+    service = PostgresDatabaseService(
+        database_port=database_port, on_data_stored=on_data_stored
+    )
+
+    await service.store_video_data(parquet_file)
+
+    database_port.bulk_insert_from_parquet.assert_awaited_once()
+    on_data_stored.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_store_video_data_failure_does_not_notify(tmp_path):
+    """Test a failed ingest leaves cached search results alone."""
+    parquet_file = tmp_path / "segment_video.parquet"
+    parquet_file.write_bytes(b"data")
+    database_port = AsyncMock()
+    database_port.bulk_insert_from_parquet.side_effect = RuntimeError("boom")
+    on_data_stored = MagicMock()
+    service = PostgresDatabaseService(
+        database_port=database_port, on_data_stored=on_data_stored
+    )
+
+    with pytest.raises(RuntimeError):
+        await service.store_video_data(parquet_file)
+
+    on_data_stored.assert_not_called()
@@ -0,0 +1,39 @@
+# Copyright (C) 2025 Veel Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from infrastructure.db_pool import PoolConfig
+from infrastructure.scheduler import TrendingSearchScheduler
+
+
+def test_default_pool_budget_holds():
+    """Test the shipped settings satisfy the pool-sizing invariant."""
+    TrendingSearchScheduler._check_pool_budget()
+
+
+def test_start_refuses_to_exceed_pool_budget(monkeypatch):
+    """Test the scheduler does not start when runs could starve the pool."""
+    monkeypatch.setattr(
+        TrendingSearchScheduler,
+        "MAX_INSTANCES",
+        PoolConfig.MAX_SIZE - TrendingSearchScheduler.POOL_SAFETY_MARGIN + 1,
+    )
+    scheduler = TrendingSearchScheduler()
+
+    with pytest.raises(ValueError):
+        scheduler.start()
+
+    assert not scheduler.is_running
@@ -14,10 +14,46 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pytest
+from cachetools import TTLCache
 
 from src.adapters import VideoSEOQueryAdapter
+from src.adapters import video_seo_query_pipeline_adapter as pipeline
+from src.adapters.video_seo_query_pipeline_adapter import clear_search_cache
+from src.domain.models import VideoSEOResponseModel
+
+
+@pytest.fixture(autouse=True)
+def empty_search_cache():
+    """Keep cached search results from leaking between tests."""
+    clear_search_cache()
+    yield
+    clear_search_cache()
+
+
+def make_search_adapter(results=None):
+    mock_db = AsyncMock()
+    mock_openai = AsyncMock()
+    mock_openai.text_embedding.return_value = [[0.1] * 1536]
+    mock_db.search_similar_vectors.return_value = (
+        [
+            {
+                "video_id": "123",
+                "segment_text": "Some text",
+                "segment_start_time": 0.0,
+                "segment_end_time": 10.0,
+                "distance": 0.1,
+            }
+        ]
+        if results is None
+        else results
+    )
+    adapter = VideoSEOQueryAdapter(
+        database_port=mock_db, openai_client_port=mock_openai
+    )
+    return adapter, mock_db, mock_openai
 
 
 @pytest.mark.asyncio
@@ -56,3 +92,60 @@ async def test_async_get_video_seo_query():
     assert result_no_embed["status"] == "Error"
     assert result_no_embed["results"] == []
     assert "Embedding" in result_no_embed["error"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_uses_search_cache():
+    adapter, mock_db, mock_openai = make_search_adapter()
+
+    first = await adapter.async_get_video_seo_query("Cached  query", chat_id=uuid4())
+    second = await adapter.async_get_video_seo_query("cached query ", chat_id=uuid4())
+
+    assert first["results"] == second["results"]
+    mock_openai.text_embedding.assert_awaited_once()
+    mock_db.search_similar_vectors.assert_awaited_once()
+    assert mock_db.insert_into_session_table.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_without_hits_returns_empty_response_without_session_row():
+    adapter, mock_db, _ = make_search_adapter(results=[])
+
+    result = await adapter.async_get_video_seo_query("no hits", chat_id=uuid4())
+
+    assert result == VideoSEOResponseModel().model_dump(exclude_none=True)
+    mock_db.insert_into_session_table.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_distinct_queries_miss_search_cache():
+    adapter, mock_db, _ = make_search_adapter()
+
+    await adapter.async_get_video_seo_query("cat videos", chat_id=uuid4())
+    await adapter.async_get_video_seo_query("dog videos", chat_id=uuid4())
+
+    assert mock_db.search_similar_vectors.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_or_cleared_search_cache_entries_miss(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        pipeline,
+        "_search_cache",
+        TTLCache(
+            maxsize=pipeline.SearchCacheConfig.MAX_SIZE,
+            ttl=pipeline.SearchCacheConfig.TTL_SECONDS,
+            timer=lambda: now[0],
+        ),
+    )
+    adapter, mock_db, _ = make_search_adapter()
+
+    await adapter.async_get_video_seo_query("cat videos", chat_id=uuid4())
+    now[0] += pipeline.SearchCacheConfig.TTL_SECONDS + 1
+    await adapter.async_get_video_seo_query("cat videos", chat_id=uuid4())
+    assert mock_db.search_similar_vectors.await_count == 2
+
+    clear_search_cache()
+    await adapter.async_get_video_seo_query("cat videos", chat_id=uuid4())
+    assert mock_db.search_similar_vectors.await_count == 3
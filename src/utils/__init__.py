@@ -14,9 +14,13 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from src.utils.helpers import (
+    choose_cut_points,
+    detect_silences,
     extract_audio_from_video,
     file_exists_and_nonempty,
+    get_media_duration,
     get_media_type,
+    split_audio,
 )
 from src.utils.singleton_metaclass import SingletonABCMeta, SingletonMetaClass
 
@@ -24,6 +28,10 @@ __all__ = [
     "file_exists_and_nonempty",
     "extract_audio_from_video",
     "get_media_type",
+    "get_media_duration",
+    "split_audio",
+    "choose_cut_points",
+    "detect_silences",
     "SingletonABCMeta",
     "SingletonMetaClass",
 ]
@@ -14,7 +14,9 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import asyncio
+import csv
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +25,8 @@ logger = logging.getLogger(__name__)
 CURRENT_DIR = Path(__file__).resolve().parent
 AUDIO_DIR = CURRENT_DIR / ".." / ".." / "media" / "audio"
 
+SILENCE_LOG_PATTERN = re.compile(r"silence_(start|end): (-?\d+(?:\.\d+)?)")
+
 
 async def run_ffmpeg_command(command: list[str]) -> dict[str, Any]:
     """
@@ -48,6 +52,7 @@ async def run_ffmpeg_command(command: list[str]) -> dict[str, Any]:
             return {
                 "status": "success",
                 "output": stdout.decode().strip(),
+                "log": stderr.decode(errors="replace"),
                 "error": None,
             }
 
@@ -100,6 +105,169 @@ async def extract_audio_from_video(video_path: str) -> str | dict[str, Any] | No
         logger.exception(f"Exception during ffmpeg execution: {e}")
 
 
+async def get_media_duration(media_path: str) -> float | None:
+    """
+    Helper function to read the duration of a media file with ffprobe
+
+    Args:
+        media_path: Path to the media file
+    Returns:
+        float: Duration in seconds
+        None: If the duration could not be determined
+    """
+    probe_cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "csv=p=0",
+        str(media_path),
+    ]
+    result = await run_ffmpeg_command(probe_cmd)
+    if result["status"] != "success":
+        return None
+    try:
+        return float(result["output"])
+    except (TypeError, ValueError):
+        return None
+
+
+async def detect_silences(
+    audio_path: str, noise_db: int = -35, min_silence_seconds: float = 0.3
+) -> list[tuple[float, float]]:
+    """
+    Helper function to find the silent stretches of an audio file
+
+    Args:
+        audio_path: Path to the audio file
+        noise_db: Level below which audio counts as silence
+        min_silence_seconds: Shortest stretch reported
+    Returns:
+        list: (start, end) pairs in seconds, in playback order; empty if
+            detection failed
+    """
+    detect_cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-i",
+        str(audio_path),
+        "-af",
+        f"silencedetect=noise={noise_db}dB:d={min_silence_seconds}",
+        "-f",
+        "null",
+        "-",
+    ]
+    result = await run_ffmpeg_command(detect_cmd)
+    if result["status"] != "success":
+        return []
+
+    silences = []
+    start = None
+    for kind, value in SILENCE_LOG_PATTERN.findall(result["log"]):
+        if kind == "start":
+            start = max(0.0, float(value))
+        elif start is not None:
+            silences.append((start, float(value)))
+            start = None
+    return silences
+
+
+def choose_cut_points(
+    duration: float,
+    silences: list[tuple[float, float]],
+    chunk_seconds: float,
+    search_seconds: float,
+) -> list[float]:
+    """
+    Helper function to pick chunk boundaries that fall in silences
+
+    Each boundary is the middle of the silence nearest `chunk_seconds` after
+    the previous one, looked for within `search_seconds` either side, so no
+    word is cut in two. Without a silence in range the boundary stays at
+    `chunk_seconds`.
+
+    Args:
+        duration: Length of the audio in seconds
+        silences: (start, end) silent stretches, as from `detect_silences`
+        chunk_seconds: Target chunk length in seconds
+        search_seconds: How far a boundary may move to reach a silence
+    Returns:
+        list: Increasing cut points in seconds, excluding 0 and the end
+    """
+    midpoints = [(start + end) / 2 for start, end in silences]
+    cuts = []
+    last = 0.0
+    while last + chunk_seconds < duration:
+        target = last + chunk_seconds
+        candidates = [
+            m
+            for m in midpoints
+            if last < m < duration and abs(m - target) <= search_seconds
+        ]
+        last = min(candidates, key=lambda m: abs(m - target)) if candidates else target
+        cuts.append(last)
+    return cuts
+
+
+async def split_audio(
+    audio_path: str,
+    output_dir: Path,
+    chunk_seconds: int = 30,
+    cut_points: list[float] | None = None,
+) -> list[tuple[str, float]]:
+    """
+    Helper function to split an audio file into chunks
+
+    Args:
+        audio_path: Path to the audio file
+        output_dir: Existing directory the chunks are written to
+        chunk_seconds: Target chunk length in seconds, used without `cut_points`
+        cut_points: Explicit cut times in seconds, e.g. from `choose_cut_points`
+    Returns:
+        list: (chunk path, start offset in seconds) pairs in playback order;
+            empty if splitting failed
+    """
+    audio_path = Path(audio_path)
+    segment_list = output_dir / "segments.csv"
+    if cut_points:
+        split_at = ["-segment_times", ",".join(f"{t:.3f}" for t in cut_points)]
+    else:
+        split_at = ["-segment_time", str(chunk_seconds)]
+    split_cmd = [
+        "ffmpeg",
+        "-i",
+        str(audio_path),
+        "-f",
+        "segment",
+        *split_at,
+        "-segment_list",
+        str(segment_list),
+        "-segment_list_type",
+        "csv",
+        "-reset_timestamps",
+        "1",
+        "-c",
+        "copy",
+        str(output_dir / f"{audio_path.stem}_%04d{audio_path.suffix}"),
+        "-y",
+    ]
+    result = await run_ffmpeg_command(split_cmd)
+    if result["status"] != "success":
+        return []
+
+    # Each CSV row is "filename,start,end" with the actual cut points, which
+    # differ slightly from the requested ones when copying frames. ffmpeg
+    # quotes file names that contain commas or quotes.
+    rows = await asyncio.to_thread(segment_list.read_text)
+    return [
+        (str(output_dir / name), float(start))
+        for name, start, _end in csv.reader(rows.splitlines())
+    ]
+
+
 async def file_exists_and_nonempty(file_path: Path) -> bool:
     """
     Helper function to check if a file exists and non-empty